@@ -1,13 +1,19 @@
+import time
+
+# 记录模块导入耗时，用于评估插件对宿主启动和插件重载的影响
+_import_started = time.perf_counter()
+
 import datetime
 import threading
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Tuple
 
 import pytz
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app import schemas
 from app.core.config import settings
-from app.helper.downloader import DownloaderHelper
 from app.log import logger
 from app.plugins import _PluginBase
 from app.schemas import NotificationType, ServiceInfo
@@ -15,6 +21,74 @@ from app.utils.string import StringUtils
 
 lock = threading.Lock()
 
+# 模块导入耗时（秒）
+_import_timings: Dict[str, float] = {}
+
+
+class _Metrics:
+    """
+    Minimal in-process metrics registry rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, prefix: str, definitions: Dict[str, Tuple[str, str]]):
+        # definitions: name -> (type, help)，type 为 counter、gauge 或 summary
+        self._prefix = prefix
+        self._definitions = definitions
+        self._values: Dict[str, Dict[Tuple[Tuple[str, str], ...], List[float]]] = {
+            name: {} for name in definitions
+        }
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        with self._lock:
+            sample = self._values[name].setdefault(tuple(sorted(labels.items())), [0.0])
+            sample[0] += value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._values[name][tuple(sorted(labels.items()))] = [float(value)]
+
+    def observe(self, name: str, seconds: float, **labels):
+        with self._lock:
+            sample = self._values[name].setdefault(tuple(sorted(labels.items())), [0.0, 0.0])
+            sample[0] += 1
+            sample[1] += seconds
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                   for _, value in labels)
+        return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+    @staticmethod
+    def _number(value: float) -> str:
+        return str(int(value)) if float(value).is_integer() else repr(value)
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (mtype, help_text) in self._definitions.items():
+                full_name = f"{self._prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {mtype}")
+                for labels, sample in self._values[name].items():
+                    if mtype == "summary":
+                        lines.append(f"{full_name}_count{self._labels(labels)} {self._number(sample[0])}")
+                        lines.append(f"{full_name}_sum{self._labels(labels)} {self._number(sample[1])}")
+                    else:
+                        lines.append(f"{full_name}{self._labels(labels)} {self._number(sample[0])}")
+        return "\n".join(lines) + "\n"
+
 
 class QbFinishedCleanup(_PluginBase):
     # 插件名称
@@ -24,7 +98,7 @@ class QbFinishedCleanup(_PluginBase):
     # 插件图标
     plugin_icon = "delete.jpg"
     # 插件版本
-    plugin_version = "1.0.3"
+    plugin_version = "1.0.6"
     # 插件作者
     plugin_author = "misaya"
     # 作者主页
@@ -48,6 +122,18 @@ class QbFinishedCleanup(_PluginBase):
     _min_seed_days: str = "3"
     _completed_only: bool = True
     _dry_run: bool = False
+    _time_budget: str = "0"
+    _size_budget: str = "0"
+
+    # 运行指标，进程内累计，通过 /metrics 以 Prometheus 文本格式导出
+    _metrics = _Metrics(prefix="moviepilot_qbfinishedcleanup", definitions={
+        "torrents_scanned_total": ("counter", "Torrents returned by the downloader for the cleanup tags."),
+        "torrents_eligible_total": ("counter", "Torrents that met the seeding threshold."),
+        "torrents_deleted_total": ("counter", "Torrents deleted (or reported in dry-run mode)."),
+        "bytes_freed_total": ("counter", "Bytes freed by deleted torrents."),
+        "api_seconds": ("summary", "Downloader API call latency in seconds."),
+        "import_seconds": ("gauge", "Module import time in seconds.")
+    })
 
     def init_plugin(self, config: dict = None):
         self.stop_service()
@@ -62,6 +148,8 @@ class QbFinishedCleanup(_PluginBase):
             self._min_seed_days = str(config.get("min_seed_days") or "3")
             self._completed_only = config.get("completed_only", True)
             self._dry_run = config.get("dry_run", False)
+            self._time_budget = str(config.get("time_budget") or "0")
+            self._size_budget = str(config.get("size_budget") or "0")
 
         if self.get_state() or self._onlyonce:
             if self._onlyonce:
@@ -88,7 +176,14 @@ class QbFinishedCleanup(_PluginBase):
         return []
 
     def get_api(self) -> List[Dict[str, Any]]:
-        return []
+        return [
+            {
+                "path": "/metrics",
+                "endpoint": self.metrics,
+                "methods": ["GET"],
+                "summary": "qB已整理自动清理运行指标（Prometheus文本格式）"
+            }
+        ]
 
     def get_service(self) -> List[Dict[str, Any]]:
         if self.get_state():
@@ -102,6 +197,8 @@ class QbFinishedCleanup(_PluginBase):
         return []
 
     def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
+        from app.helper.downloader import DownloaderHelper
+
         qb_items = [
             {"title": config.name, "value": config.name}
             for config in DownloaderHelper().get_configs().values()
@@ -219,6 +316,30 @@ class QbFinishedCleanup(_PluginBase):
                                     "component": "VSwitch",
                                     "props": {"model": "dry_run", "label": "试运行"}
                                 }]
+                            },
+                            {
+                                "component": "VCol",
+                                "props": {"cols": 12, "md": 3},
+                                "content": [{
+                                    "component": "VTextField",
+                                    "props": {
+                                        "model": "time_budget",
+                                        "label": "单次最长运行秒数",
+                                        "placeholder": "0 为不限制"
+                                    }
+                                }]
+                            },
+                            {
+                                "component": "VCol",
+                                "props": {"cols": 12, "md": 3},
+                                "content": [{
+                                    "component": "VTextField",
+                                    "props": {
+                                        "model": "size_budget",
+                                        "label": "单次最多释放GB",
+                                        "placeholder": "0 为不限制"
+                                    }
+                                }]
                             }
                         ]
                     },
@@ -233,6 +354,7 @@ class QbFinishedCleanup(_PluginBase):
                                     "type": "warning",
                                     "variant": "tonal",
                                     "text": "会删除 qB 任务和本地文件，只处理所选 qB 中带指定标签且保种达到指定天数的任务。"
+                                            "设置单次运行秒数或释放空间上限后，每次只处理到上限为止，下次从中断处继续。"
                                 }
                             }]
                         }]
@@ -248,7 +370,9 @@ class QbFinishedCleanup(_PluginBase):
             "tag": "已整理",
             "min_seed_days": "3",
             "completed_only": True,
-            "dry_run": False
+            "dry_run": False,
+            "time_budget": "0",
+            "size_budget": "0"
         }
 
     def get_page(self) -> List[dict]:
@@ -300,6 +424,8 @@ class QbFinishedCleanup(_PluginBase):
 
     @property
     def service_infos(self) -> Dict[str, ServiceInfo]:
+        from app.helper.downloader import DownloaderHelper
+
         services = DownloaderHelper().get_services(
             type_filter="qbittorrent",
             name_filters=self._downloaders
@@ -316,6 +442,18 @@ class QbFinishedCleanup(_PluginBase):
                 active_services[service_name] = service_info
         return active_services
 
+    def metrics(self, apikey: str):
+        """
+        以 Prometheus 文本格式导出运行指标
+        """
+        from fastapi.responses import PlainTextResponse
+
+        if apikey != settings.API_TOKEN:
+            return schemas.Response(success=False, message="API密钥错误")
+        for phase, seconds in _import_timings.items():
+            self._metrics.set("import_seconds", seconds, phase=phase)
+        return PlainTextResponse(self._metrics.render(), media_type="text/plain; version=0.0.4")
+
     def cleanup(self):
         """
         清理 qB 中指定标签的已整理任务。
@@ -334,25 +472,61 @@ class QbFinishedCleanup(_PluginBase):
         if not services:
             return
 
+        # 单次运行预算：达到时间或释放空间上限后停止，记录游标，下次从中断处继续
+        time_budget = max(0, self.__to_int(self._time_budget, 0))
+        size_budget = max(0, int(self.__to_float(self._size_budget, 0) * 1024 ** 3))
+        budget = {
+            "deadline": time.monotonic() + time_budget if time_budget else None,
+            "bytes_left": size_budget or None,
+            "processed": 0
+        }
+
         with lock:
-            for downloader_name, service_info in services.items():
+            cursor = self.get_data("cursor") or {}
+            names = list(services.keys())
+            start = names.index(cursor.get("downloader")) if cursor.get("downloader") in names else 0
+            if start:
+                logger.info(f"qB已整理自动清理：从上次中断处继续，下载器 {names[start]}")
+            for downloader_name in names[start:]:
                 if self._event.is_set():
                     logger.info("qB已整理自动清理服务停止")
                     return
-                self.__cleanup_downloader(
-                    downloader_name=downloader_name,
-                    downloader=service_info.instance,
-                    tags=tags,
-                    min_seed_seconds=min_seed_seconds
-                )
+                after_key = cursor.get("key") if downloader_name == cursor.get("downloader") else None
+                if self.__time_exhausted(budget):
+                    stop_cursor = {"downloader": downloader_name, "key": after_key}
+                else:
+                    stop_cursor = self.__cleanup_downloader(
+                        downloader_name=downloader_name,
+                        downloader=services[downloader_name].instance,
+                        tags=tags,
+                        min_seed_seconds=min_seed_seconds,
+                        budget=budget,
+                        after_key=after_key
+                    )
+                if stop_cursor:
+                    self.save_data("cursor", stop_cursor)
+                    logger.info(
+                        f"qB已整理自动清理：已达到单次运行上限，处理 {budget['processed']} 个任务，"
+                        f"下次从 {downloader_name} 继续"
+                    )
+                    return
+            # 所有下载器处理完毕，下次从头开始
+            if cursor:
+                self.save_data("cursor", {})
 
     def __cleanup_downloader(self, downloader_name: str, downloader: Any,
-                             tags: List[str], min_seed_seconds: int):
-        torrents, error = downloader.get_torrents(tags=tags)
+                             tags: List[str], min_seed_seconds: int,
+                             budget: dict, after_key: Optional[list] = None) -> Optional[dict]:
+        """
+        清理单个下载器，达到预算时返回续跑游标，处理完毕返回 None
+        """
+        with self._metrics.timer("api_seconds", downloader=downloader_name, operation="get_torrents"):
+            torrents, error = downloader.get_torrents(tags=tags)
         if error:
             logger.error(f"qB已整理自动清理：获取 {downloader_name} 种子失败")
             return
 
+        self._metrics.inc("torrents_scanned_total", len(torrents or []), downloader=downloader_name)
         candidates = []
         for torrent in torrents or []:
             if self._completed_only and not self.__is_completed(torrent):
@@ -360,22 +534,33 @@ class QbFinishedCleanup(_PluginBase):
             item = self.__build_item(torrent)
             if item and item.get("seed_seconds", 0) >= min_seed_seconds:
                 candidates.append(item)
+        self._metrics.inc("torrents_eligible_total", len(candidates), downloader=downloader_name)
+        # 跳过上次运行已处理过的任务
+        if after_key:
+            candidates = [item for item in candidates if self.__sort_key(item) > tuple(after_key)]
 
         if not candidates:
             logger.info(
                 f"qB已整理自动清理：{downloader_name} 没有符合标签 {','.join(tags)} "
                 f"且保种达到 {self.__format_duration(min_seed_seconds)} 的已完成任务"
             )
-            return
+            return None
 
-        candidates.sort(key=lambda item: (item.get("done_time") or 0, item.get("added_time") or 0))
+        candidates.sort(key=self.__sort_key)
         deleted_count = 0
         deleted_bytes = 0
+        stop_cursor = None
+        last_key = after_key
 
         for item in candidates:
             if self._event.is_set():
                 logger.info("qB已整理自动清理服务停止")
-                return
+                return None
+            if self.__budget_exhausted(budget, item.get("size") or 0):
+                stop_cursor = {"downloader": downloader_name, "key": last_key}
+                break
+            last_key = list(self.__sort_key(item))
+            budget["processed"] += 1
 
             text_item = (
                 f"{item.get('name')} "
@@ -387,7 +572,8 @@ class QbFinishedCleanup(_PluginBase):
                 logger.info(f"qB已整理自动清理试运行：将删除种子及文件：{text_item}")
                 success = True
             else:
-                success = downloader.delete_torrents(delete_file=True, ids=[item.get("id")])
+                with self._metrics.timer("api_seconds", downloader=downloader_name, operation="delete_torrents"):
+                    success = downloader.delete_torrents(delete_file=True, ids=[item.get("id")])
                 if success:
                     logger.info(f"qB已整理自动清理：已删除种子及文件：{text_item}")
                 else:
@@ -396,6 +582,10 @@ class QbFinishedCleanup(_PluginBase):
 
             deleted_count += 1
             deleted_bytes += item.get("size") or 0
+            if budget["bytes_left"] is not None:
+                budget["bytes_left"] -= item.get("size") or 0
+            self._metrics.inc("torrents_deleted_total", downloader=downloader_name)
+            self._metrics.inc("bytes_freed_total", item.get("size") or 0, downloader=downloader_name)
 
         if deleted_count:
             self.__save_history({
@@ -416,6 +606,25 @@ class QbFinishedCleanup(_PluginBase):
                 )
         else:
             logger.info(f"qB已整理自动清理：{downloader_name} 没有执行删除")
+        return stop_cursor
+
+    @staticmethod
+    def __sort_key(item: dict) -> Tuple[int, int, str]:
+        return item.get("done_time") or 0, item.get("added_time") or 0, item.get("id") or ""
+
+    @staticmethod
+    def __time_exhausted(budget: dict) -> bool:
+        return bool(budget["deadline"] and time.monotonic() >= budget["deadline"])
+
+    def __budget_exhausted(self, budget: dict, size: int) -> bool:
+        """
+        是否已达到单次运行上限；本次尚未处理任何任务时总会放行一个，避免大任务一直卡住
+        """
+        if not budget["processed"]:
+            return False
+        if self.__time_exhausted(budget):
+            return True
+        return budget["bytes_left"] is not None and size > budget["bytes_left"]
 
     def __build_item(self, torrent: Any) -> Optional[dict]:
         torrent_id = self.__torrent_attr(torrent, "hash")
@@ -453,7 +662,9 @@ class QbFinishedCleanup(_PluginBase):
             "tag": self._tag,
             "min_seed_days": self._min_seed_days,
             "completed_only": self._completed_only,
-            "dry_run": self._dry_run
+            "dry_run": self._dry_run,
+            "time_budget": self._time_budget,
+            "size_budget": self._size_budget
         })
 
     def __save_history(self, item: dict):
@@ -498,3 +709,7 @@ class QbFinishedCleanup(_PluginBase):
             return float(value)
         except (TypeError, ValueError):
             return default
+
+
+_import_timings["module"] = time.perf_counter() - _import_started
+logger.debug(f"qB已整理自动清理：模块导入耗时 {_import_timings['module'] * 1000:.1f} ms")
@@ -1,29 +1,364 @@
+import time
+
+# 记录模块导入耗时，用于评估插件对宿主启动和插件重载的影响
+_import_started = time.perf_counter()
+
+import base64
+import copy
 import datetime
+import hashlib
+import inspect
+import json
+import math
+import multiprocessing
+import random
 import re
 import traceback
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
-from typing import Optional, Any, List, Dict, Tuple
+from threading import Event, Lock
+from typing import Optional, Any, List, Dict, Tuple, Set
+from urllib.parse import urlparse, parse_qs
 
 import pytz
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app import schemas
-from app.chain.download import DownloadChain
-from app.chain.subscribe import SubscribeChain
 from app.core.config import settings
-from app.core.context import MediaInfo, TorrentInfo, Context
-from app.core.metainfo import MetaInfo
-from app.helper.rule import RuleHelper
-from app.helper.rss import RssHelper
 from app.log import logger
 from app.plugins import _PluginBase
-from app.schemas import ExistMediaInfo
 from app.schemas.types import SystemConfigKey, MediaType
 
 lock = Lock()
 
+# 模块导入和首次运行时加载下载/订阅链的耗时（秒）
+_import_timings: Dict[str, float] = {}
+# 静音下载链、订阅链类，首次运行时才导入并创建
+_silent_chains: Optional[Tuple[type, type]] = None
+_silent_chains_lock = Lock()
+
+# 发布名解析：年份、季集、分辨率、发布组
+_YEAR_RE = re.compile(r"(?<!\d)(19\d{2}|20\d{2})(?!\d)")
+# 季集支持范围：S01-S03、S01E01-E03、S01E01E02、S01E01-03、EP01-EP03
+_SEASON_EPISODE_RE = re.compile(
+    r"(?<![a-z0-9])s(\d{1,2})(?:-s?(\d{1,2}))?(?:e(\d{1,4})(?:-?e(\d{1,4})|-(\d{1,4}))?)?(?:v\d)?(?![a-z0-9])"
+    r"|(?<![a-z0-9])e[p]?(\d{1,4})(?:-?e[p]?(\d{1,4})|-(\d{1,4}))?(?:v\d)?(?![a-z0-9])"
+)
+_RESOLUTION_RE = re.compile(r"(?<!\d)(2160|1080|720|480)[pi](?![a-z0-9])|(?<![a-z0-9])4k(?![a-z0-9])")
+_GROUP_RE = re.compile(r"-([a-z0-9]+)(?:@[a-z0-9]+)?$")
+# 区分不同发布的来源、编码、版本和修订标记：WEB-DL 与 BluRay、x264 与 REMUX、REPACK/PROPER/v2 都是不同的发布
+_VARIANT_RE = re.compile(
+    r"(?<![a-z0-9])(web[-.]?dl|web[-.]?rip|web|blu[-.]?ray|bd[-.]?rip|remux|hdtv|dvd[-.]?rip|hd[-.]?rip"
+    r"|[xh][-.]?26[45]|hevc|avc|av1|xvid|repack\d?|proper|rerip"
+    r"|extended|uncut|unrated|remastered|directors?[-.]?cut|imax|criterion)(?![a-z0-9])"
+    r"|(?<![a-z])(v[2-9])(?![a-z0-9])"
+)
+_NAME_NOISE_RE = re.compile(r"[^0-9a-z\u4e00-\u9fff]+")
+# 名称末尾的续集序号：数字、罗马数字、Part/Chapter/Vol N
+_SEQUEL_RE = re.compile(r"(?:^|\s)(?:\d+|[ivx]+|(?:part|chapter|vol|volume) \w+)$")
+
+
+def _release_fingerprint(title: str) -> Optional[str]:
+    """
+    Normalized release fingerprint: name, year, season/episode (with range end), resolution,
+    source/codec/edition/revision markers and group.
+    Returns None when the title carries too little structure to be matched safely.
+    """
+    text = title.lower().strip()
+    season_episode = _SEASON_EPISODE_RE.search(text)
+    resolution = _RESOLUTION_RE.search(text)
+    group = _GROUP_RE.search(text)
+    # 片名里可能带年份样的数字（Blade Runner 2049），取季集和分辨率之前的最后一个
+    bound = min((m.start() for m in (season_episode, resolution) if m), default=len(text))
+    years = [m for m in _YEAR_RE.finditer(text) if m.start() < bound]
+    year = years[-1] if years else None
+    if not year and not season_episode:
+        return None
+    name_end = min(m.start() for m in (year, season_episode, resolution) if m)
+    name = _NAME_NOISE_RE.sub("", text[:name_end])
+    if not name:
+        return None
+    if season_episode:
+        season, season_end, episode, *episode_ends = season_episode.groups()
+        episode = episode or episode_ends[2]
+        episode_end = next((end for end in episode_ends[:2] + episode_ends[3:] if end), None)
+        value = f"s{int(season) if season else 0}"
+        if season_end:
+            value += f"-{int(season_end)}"
+        if episode:
+            value += f"e{int(episode)}"
+            if episode_end:
+                value += f"-{int(episode_end)}"
+        season_episode = value
+    tail = text[name_end:group.start() if group else len(text)]
+    variants = sorted({re.sub(r"[-.]", "", m.group(m.lastindex)) for m in _VARIANT_RE.finditer(tail)})
+    return "|".join([
+        name,
+        year.group(1) if year else "",
+        season_episode or "",
+        (resolution.group(1) or "2160") if resolution else "",
+        "+".join(variants),
+        group.group(1) if group else ""
+    ])
+
+
+def _magnet_info_hash(*urls: Optional[str]) -> Optional[str]:
+    """
+    Extract the BitTorrent info-hash from a magnet link, normalized to lowercase hex.
+    """
+    for url in urls:
+        if not url or not url.startswith("magnet:"):
+            continue
+        for xt in parse_qs(urlparse(url).query).get("xt", []):
+            if not xt.lower().startswith("urn:btih:"):
+                continue
+            value = xt[9:]
+            if len(value) == 40:
+                return value.lower()
+            if len(value) == 32:
+                try:
+                    return base64.b32decode(value.upper()).hex()
+                except ValueError:
+                    continue
+    return None
+
+
+def _parse_titles(pairs: List[Tuple[str, Optional[str]]]) -> List[Any]:
+    """
+    Parse a chunk of (title, subtitle) pairs; runs in a worker process.
+    """
+    from app.core.metainfo import MetaInfo
+
+    return [MetaInfo(title=title, subtitle=subtitle) for title, subtitle in pairs]
+
+
+def _bdecode(data: bytes, index: int = 0) -> Tuple[Any, int]:
+    """
+    Decode one bencoded value starting at index; returns (value, end index).
+    Strings and dict keys stay bytes.
+    """
+    token = data[index:index + 1]
+    if token == b"i":
+        end = data.index(b"e", index)
+        return int(data[index + 1:end]), end + 1
+    if token == b"l":
+        index += 1
+        items = []
+        while data[index:index + 1] != b"e":
+            value, index = _bdecode(data, index)
+            items.append(value)
+        return items, index + 1
+    if token == b"d":
+        index += 1
+        result = {}
+        while data[index:index + 1] != b"e":
+            key, index = _bdecode(data, index)
+            result[key], index = _bdecode(data, index)
+        return result, index + 1
+    if token.isdigit():
+        colon = data.index(b":", index)
+        start = colon + 1
+        end = start + int(data[index:colon])
+        if end > len(data):
+            raise ValueError("truncated bencode string")
+        return data[start:end], end
+    raise ValueError(f"invalid bencode token at {index}")
+
+
+def _torrent_meta(data: bytes) -> dict:
+    """
+    Read info-hash, name, total size and file list from .torrent bytes.
+    """
+    if data[:1] != b"d":
+        raise ValueError("not a torrent file")
+    index = 1
+    info, info_bytes = None, b""
+    while data[index:index + 1] != b"e":
+        key, index = _bdecode(data, index)
+        start = index
+        value, index = _bdecode(data, index)
+        if key == b"info":
+            info, info_bytes = value, data[start:index]
+    if not isinstance(info, dict):
+        raise ValueError("torrent has no info dict")
+    name = info.get(b"name", b"").decode("utf-8", "replace")
+    if isinstance(info.get(b"files"), list):
+        files = [("/".join(part.decode("utf-8", "replace") for part in item.get(b"path", [])),
+                  item.get(b"length", 0))
+                 for item in info[b"files"]]
+    else:
+        files = [(name, info.get(b"length", 0))]
+    return {
+        "info_hash": hashlib.sha1(info_bytes).hexdigest(),
+        "name": name,
+        "size": sum(length for _, length in files),
+        "files": [path for path, _ in files]
+    }
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter used as a cheap membership pre-check.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(64, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class _ScalableBloomFilter:
+    """
+    Growable Bloom filter: a new, larger and stricter slice is appended when the current one fills up.
+    """
+
+    def __init__(self, initial_capacity: int = 10000, error_rate: float = 0.001):
+        self._initial_capacity = initial_capacity
+        self._error_rate = error_rate
+        self.filters: List[_BloomFilter] = []
+
+    def add(self, key: str):
+        if key in self:
+            return
+        if not self.filters or self.filters[-1].count >= self.filters[-1].capacity:
+            level = len(self.filters)
+            self.filters.append(_BloomFilter(capacity=self._initial_capacity * 2 ** level,
+                                             error_rate=self._error_rate * 0.5 ** level))
+        self.filters[-1].add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in bloom for bloom in self.filters)
+
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+
+    def save(self, path: Path):
+        header = json.dumps([[bloom.capacity, bloom.error_rate, bloom.count] for bloom in self.filters])
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header.encode("utf-8") + b"\n")
+            for bloom in self.filters:
+                f.write(bloom.bits)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "_ScalableBloomFilter":
+        seen = cls()
+        if not path or not path.exists():
+            return seen
+        with open(path, "rb") as f:
+            for capacity, error_rate, count in json.loads(f.readline().decode("utf-8")):
+                bloom = _BloomFilter(capacity=capacity, error_rate=error_rate)
+                bloom.bits = bytearray(f.read(len(bloom.bits)))
+                bloom.count = count
+                seen.filters.append(bloom)
+        return seen
+
+
+class _DedupIndex:
+    """
+    Cross-feed duplicate index keyed by info-hash and release fingerprint,
+    with a Bloom filter in front of the exact key store.
+    """
+
+    def __init__(self, keys: Dict[str, float], limit: int = 20000):
+        self._limit = limit
+        self._keys = dict(sorted(keys.items(), key=lambda item: item[1])[-limit:])
+        self._bloom = _BloomFilter(capacity=max(len(self._keys) * 2, 10000))
+        for key in self._keys:
+            self._bloom.add(key)
+
+    @staticmethod
+    def item_keys(title: str, enclosure: Optional[str], link: Optional[str]) -> List[str]:
+        keys = []
+        info_hash = _magnet_info_hash(enclosure, link)
+        if info_hash:
+            keys.append(f"hash:{info_hash}")
+        fingerprint = _release_fingerprint(title)
+        if fingerprint:
+            keys.append(f"release:{fingerprint}")
+        return keys
+
+    def find(self, keys: List[str]) -> Optional[str]:
+        for key in keys:
+            if key in self._bloom and key in self._keys:
+                return key
+        return None
+
+    def add(self, keys: List[str]):
+        for key in keys:
+            if key in self._keys:
+                continue
+            if self._bloom.count >= self._bloom.capacity:
+                # 超出容量时重建，保持误判率
+                self._bloom = _BloomFilter(capacity=max(len(self._keys) * 2, 10000))
+                for existing in self._keys:
+                    self._bloom.add(existing)
+            self._keys[key] = time.time()
+            self._bloom.add(key)
+
+    def remove(self, keys: List[str]):
+        # 布隆过滤器不支持删除，精确键集合中删除即可，过滤器的残留只影响预判
+        for key in keys:
+            self._keys.pop(key, None)
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(sorted(self._keys.items(), key=lambda item: item[1])[-self._limit:])
+
+
+class _RejectionCache:
+    """
+    Items rejected by the pipeline, keyed by RSS title. Each entry records the rejecting
+    stage, a hash of the effective filter config and the decision time; an entry only
+    applies while the config hash matches and the stage TTL (if any) has not expired.
+    """
+
+    def __init__(self, entries: Dict[str, list], ttls: Dict[str, int],
+                 keep: int = 7 * 24 * 3600, limit: int = 20000):
+        self._ttls = ttls
+        self._keep = keep
+        self._limit = limit
+        self._entries = entries
+
+    def find(self, key: str, version: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if not entry or entry[1] != version:
+            return None
+        stage, _, decided = entry
+        ttl = self._ttls.get(stage)
+        if ttl and time.time() - decided >= ttl:
+            return None
+        return stage
+
+    def add(self, key: str, stage: str, version: str):
+        self._entries[key] = [stage, version, time.time()]
+
+    def to_dict(self) -> Dict[str, list]:
+        # 条目离开RSS源后不再命中，超过保留时间即丢弃
+        oldest = time.time() - self._keep
+        entries = [(key, entry) for key, entry in self._entries.items() if entry[2] >= oldest]
+        return dict(sorted(entries, key=lambda item: item[1][2])[-self._limit:])
+
 
 class _SilentMessageHelper:
     """
@@ -41,41 +376,471 @@ class _SilentMessageHelper:
         return getattr(self._wrapped, item)
 
 
-class SilentDownloadChain(DownloadChain):
+class _HistoryIndex:
     """
-    DownloadChain variant that keeps download behavior but suppresses notifications.
+    Indexes over history records by key, display title, type and time, used for selective deletion.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.messagehelper = _SilentMessageHelper(self.messagehelper)
+    def __init__(self, records: List[dict]):
+        self.records = records
+        self.by_key: Dict[str, List[int]] = {}
+        self.by_title: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        for i, record in enumerate(records):
+            self.by_key.setdefault(record.get("key"), []).append(i)
+            self.by_title.setdefault(record.get("title"), []).append(i)
+            self.by_type.setdefault(record.get("type"), []).append(i)
+        self.by_time = sorted(range(len(records)), key=lambda i: records[i].get("time") or "")
+        self.times = [records[i].get("time") or "" for i in self.by_time]
 
-    def post_message(self, *args, **kwargs):
-        logger.info("自定义订阅无通知：已屏蔽下载链通知")
-        return None
+    def select(self, keys: Optional[List[str]] = None, titles: Optional[List[str]] = None,
+               pattern: Optional[re.Pattern] = None, mtype: Optional[str] = None,
+               start: Optional[str] = None, end: Optional[str] = None) -> Set[int]:
+        """
+        Return positions of records matching all given conditions.
+        """
+        selected: Optional[Set[int]] = None
 
-    async def async_post_message(self, *args, **kwargs):
-        logger.info("自定义订阅无通知：已屏蔽下载链异步通知")
-        return None
+        def narrow(ids):
+            nonlocal selected
+            ids = set(ids)
+            selected = ids if selected is None else selected & ids
+
+        if keys is not None:
+            narrow(i for key in keys for i in self.by_key.get(key, []))
+        if titles is not None:
+            narrow(i for title in titles for i in self.by_title.get(title, []))
+        if pattern is not None:
+            narrow(i for index in (self.by_title, self.by_key)
+                   for text, ids in index.items() if text and pattern.search(text)
+                   for i in ids)
+        if mtype:
+            narrow(self.by_type.get(mtype, []))
+        if start or end:
+            low = bisect_left(self.times, start) if start else 0
+            high = bisect_right(self.times, end) if end else len(self.times)
+            narrow(self.by_time[low:high])
+        return selected or set()
 
 
-class SilentSubscribeChain(SubscribeChain):
+class _AliasIndex:
     """
-    SubscribeChain variant that keeps subscription behavior but suppresses notifications.
+    Normalized media name -> (tmdbid, type, year) aliases learned from history and
+    confirmed recognitions, with a trigram index for fuzzy lookups.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.messagehelper = _SilentMessageHelper(self.messagehelper)
+    def __init__(self, aliases: Dict[str, list], limit: int = 20000, threshold: float = 0.85):
+        self._limit = limit
+        self._threshold = threshold
+        # 名称 -> [tmdbid, 类型, 年份, 记录时间]
+        self._aliases: Dict[str, list] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._lock = Lock()
+        self.dirty = False
+        for name, alias in sorted(aliases.items(), key=lambda item: item[1][3])[-limit:]:
+            self.__put(name, alias)
 
-    def post_message(self, *args, **kwargs):
-        logger.info("自定义订阅无通知：已屏蔽订阅链通知")
-        return None
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    @staticmethod
+    def normalize(name: Optional[str]) -> str:
+        return " ".join(re.sub(r"[\W_]+", " ", str(name or "").lower()).split())
+
+    @staticmethod
+    def trigrams(name: str) -> Set[str]:
+        padded = f"  {name} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def __put(self, name: str, alias: list):
+        self._aliases[name] = alias
+        for gram in self.trigrams(name):
+            self._grams.setdefault(gram, set()).add(name)
+
+    @staticmethod
+    def distinct(name: str, candidate: str) -> bool:
+        """
+        Fuzzy candidates that differ by a sequel number or by whole added words
+        (a spin-off or subtitle) name a different title, not a spelling variant.
+        """
+        if _SEQUEL_RE.search(candidate):
+            return True
+        words, other = set(name.split()), set(candidate.split())
+        return words < other or other < words
+
+    def add(self, name: Optional[str], tmdbid: Any, mtype: str, year: Optional[str]):
+        name = self.normalize(name)
+        if not name or not tmdbid:
+            return
+        with self._lock:
+            current = self._aliases.get(name)
+            if current and current[:3] == [tmdbid, mtype, year]:
+                return
+            self.__put(name, [tmdbid, mtype, year, time.time()])
+            self.dirty = True
+
+    def find(self, name: Optional[str], year: Optional[str] = None,
+             mtype: Optional[str] = None) -> Optional[Tuple[Any, str, Optional[str], float]]:
+        """
+        Return (tmdbid, type, year, score) for a confident match, else None.
+        A fuzzy match must clear the threshold and beat the best match for any
+        other media by a clear margin; names ending in a sequel number only match exactly.
+        """
+        name = self.normalize(name)
+        if not name:
+            return None
+        grams = self.trigrams(name)
+        with self._lock:
+            if name in self._aliases:
+                scored = {name: 1.0}
+            elif _SEQUEL_RE.search(name):
+                scored = {}
+            else:
+                shared: Dict[str, int] = {}
+                for gram in grams:
+                    for candidate in self._grams.get(gram, ()):
+                        shared[candidate] = shared.get(candidate, 0) + 1
+                scored = {candidate: 2 * count / (len(grams) + len(self.trigrams(candidate)))
+                          for candidate, count in shared.items() if not self.distinct(name, candidate)}
+            best: Dict[Any, Tuple[float, list]] = {}
+            for candidate, score in scored.items():
+                tmdbid, alias_type, alias_year, _ = self._aliases[candidate]
+                if mtype and alias_type != mtype:
+                    continue
+                # 同名的重启剧集和翻拍电影靠年份区分，年份不一致时交给正常识别
+                if year and alias_year and str(year) != str(alias_year):
+                    continue
+                key = (tmdbid, alias_type)
+                if score > best.get(key, (0, None))[0]:
+                    best[key] = (score, self._aliases[candidate])
+        ranked = sorted(best.values(), key=lambda item: item[0], reverse=True)
+        if not ranked or ranked[0][0] < self._threshold:
+            return None
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < 0.1:
+            return None
+        score, (tmdbid, alias_type, alias_year, _) = ranked[0]
+        return tmdbid, alias_type, alias_year, score
+
+    def to_dict(self) -> Dict[str, list]:
+        with self._lock:
+            self.dirty = False
+            return dict(sorted(self._aliases.items(), key=lambda item: item[1][3])[-self._limit:])
+
+
+class _LibraryIndex:
+    """
+    Media-library snapshot: movie TMDB ids and per-season episode bitmaps for TV.
+    """
+
+    def __init__(self):
+        self.movies: Set[int] = set()
+        self.episodes: Dict[int, Dict[int, int]] = {}
+        self.loaded = time.time()
+
+    def __len__(self) -> int:
+        return len(self.movies) + len(self.episodes)
 
-    async def async_post_message(self, *args, **kwargs):
-        logger.info("自定义订阅无通知：已屏蔽订阅链异步通知")
+    @staticmethod
+    def mask(episodes: Optional[List[Any]]) -> int:
+        bits = 0
+        for episode in episodes or []:
+            try:
+                bits |= 1 << int(episode)
+            except (TypeError, ValueError):
+                continue
+        return bits
+
+    def add(self, mtype: str, tmdbid: Any, seasons: Optional[Dict[Any, List[Any]]] = None):
+        try:
+            tmdbid = int(tmdbid)
+        except (TypeError, ValueError):
+            return
+        if mtype == MediaType.MOVIE.value:
+            self.movies.add(tmdbid)
+            return
+        show = self.episodes.setdefault(tmdbid, {})
+        for season, episodes in (seasons or {}).items():
+            try:
+                season = int(season)
+            except (TypeError, ValueError):
+                continue
+            show[season] = show.get(season, 0) | self.mask(episodes)
+
+    def has_movie(self, tmdbid: Any) -> bool:
+        return int(tmdbid) in self.movies
+
+    def has_episodes(self, tmdbid: Any, season: Optional[int], episodes: Optional[List[Any]]) -> bool:
+        have = self.episodes.get(int(tmdbid), {}).get(season, 0)
+        need = self.mask(episodes)
+        if not need:
+            return bool(have)
+        return have & need == need
+
+
+class _SubscriptionIndex:
+    """
+    Existing subscriptions keyed by TMDB/Douban id and season, mirroring
+    SubscribeOper.exists: a lookup without a season matches any season.
+    """
+
+    def __init__(self):
+        self._media: Set[str] = set()
+        self._seasons: Set[Tuple[str, int]] = set()
+
+    @staticmethod
+    def media_key(tmdbid: Any, doubanid: Any) -> Optional[str]:
+        if tmdbid:
+            return f"tmdb:{tmdbid}"
+        if doubanid:
+            return f"douban:{doubanid}"
         return None
 
+    def add(self, tmdbid: Any, doubanid: Any, season: Optional[int]):
+        key = self.media_key(tmdbid, doubanid)
+        if not key:
+            return
+        self._media.add(key)
+        if season:
+            self._seasons.add((key, int(season)))
+
+    def exists(self, tmdbid: Any, doubanid: Any, season: Optional[int]) -> bool:
+        key = self.media_key(tmdbid, doubanid)
+        if not key:
+            return False
+        if season:
+            return (key, int(season)) in self._seasons
+        return key in self._media
+
+
+class _TtlCache:
+    """
+    Thread-safe key/value cache whose entries expire after a per-entry TTL.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._lock = Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return default
+            if entry[1] < time.time():
+                del self._entries[key]
+                return default
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+
+    def expires_within(self, key: str, seconds: float) -> bool:
+        """
+        Missing entries count as expiring.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return not entry or entry[1] < time.time() + seconds
+
+    def expiring(self, seconds: float) -> List[Tuple[str, Any]]:
+        """
+        Entries still valid but expiring within the given number of seconds.
+        """
+        now = time.time()
+        with self._lock:
+            return [(key, value) for key, (value, expires) in self._entries.items()
+                    if now <= expires < now + seconds]
+
+    def prune(self):
+        """
+        Drop expired entries that were never read again.
+        """
+        now = time.time()
+        with self._lock:
+            for key in [key for key, (_, expires) in self._entries.items() if expires < now]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _Metrics:
+    """
+    Minimal in-process metrics registry rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, prefix: str, definitions: Dict[str, Tuple[str, str]]):
+        # definitions: name -> (type, help)，type 为 counter、gauge 或 summary
+        self._prefix = prefix
+        self._definitions = definitions
+        self._values: Dict[str, Dict[Tuple[Tuple[str, str], ...], List[float]]] = {
+            name: {} for name in definitions
+        }
+        self._lock = Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        with self._lock:
+            sample = self._values[name].setdefault(tuple(sorted(labels.items())), [0.0])
+            sample[0] += value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._values[name][tuple(sorted(labels.items()))] = [float(value)]
+
+    def observe(self, name: str, seconds: float, **labels):
+        with self._lock:
+            sample = self._values[name].setdefault(tuple(sorted(labels.items())), [0.0, 0.0])
+            sample[0] += 1
+            sample[1] += seconds
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                   for _, value in labels)
+        return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+    @staticmethod
+    def _number(value: float) -> str:
+        return str(int(value)) if float(value).is_integer() else repr(value)
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (mtype, help_text) in self._definitions.items():
+                full_name = f"{self._prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {mtype}")
+                for labels, sample in self._values[name].items():
+                    if mtype == "summary":
+                        lines.append(f"{full_name}_count{self._labels(labels)} {self._number(sample[0])}")
+                        lines.append(f"{full_name}_sum{self._labels(labels)} {self._number(sample[1])}")
+                    else:
+                        lines.append(f"{full_name}{self._labels(labels)} {self._number(sample[0])}")
+        return "\n".join(lines) + "\n"
+
+
+class _TokenBucket:
+    """
+    Token bucket limiting the request rate against a single tracker host.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = 1.0):
+        self._rate = rate_per_minute / 60
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def __refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available, without waiting.
+        """
+        with self._lock:
+            self.__refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self, event: Event) -> bool:
+        """
+        Wait for a token; returns False if the event is set while waiting.
+        """
+        while True:
+            with self._lock:
+                self.__refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+            if event.wait(wait):
+                return False
+
+
+def _load_silent_chains() -> Tuple[type, type]:
+    """
+    Import the MoviePilot download/subscribe chains on first use and build their silent subclasses.
+    """
+    global _silent_chains
+    with _silent_chains_lock:
+        if _silent_chains:
+            return _silent_chains
+        started = time.perf_counter()
+        from app.chain.download import DownloadChain
+        from app.chain.subscribe import SubscribeChain
+
+        class SilentDownloadChain(DownloadChain):
+            """
+            DownloadChain variant that keeps download behavior but suppresses notifications.
+            """
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.messagehelper = _SilentMessageHelper(self.messagehelper)
+
+            def post_message(self, *args, **kwargs):
+                logger.info("自定义订阅无通知：已屏蔽下载链通知")
+                return None
+
+            async def async_post_message(self, *args, **kwargs):
+                logger.info("自定义订阅无通知：已屏蔽下载链异步通知")
+                return None
+
+        class SilentSubscribeChain(SubscribeChain):
+            """
+            SubscribeChain variant that keeps subscription behavior but suppresses notifications.
+            """
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.messagehelper = _SilentMessageHelper(self.messagehelper)
+
+            def post_message(self, *args, **kwargs):
+                logger.info("自定义订阅无通知：已屏蔽订阅链通知")
+                return None
+
+            async def async_post_message(self, *args, **kwargs):
+                logger.info("自定义订阅无通知：已屏蔽订阅链异步通知")
+                return None
+
+        _silent_chains = (SilentDownloadChain, SilentSubscribeChain)
+        _import_timings["chains"] = time.perf_counter() - started
+        logger.info(f"自定义订阅无通知：加载下载/订阅链耗时 {_import_timings['chains'] * 1000:.1f} ms")
+        return _silent_chains
+
+
+class _ChainContext:
+    """
+    Silent chains and helpers reused across runs; rebuilt only when the plugin is reconfigured.
+    """
+
+    def __init__(self):
+        from app.helper.rss import RssHelper
+        from app.helper.rule import RuleHelper
+
+        silent_download_chain, silent_subscribe_chain = _load_silent_chains()
+        self.downloadchain = silent_download_chain()
+        self.subscribechain = silent_subscribe_chain()
+        self.rulehelper = RuleHelper()
+        self.rsshelper = RssHelper()
+
 
 class RssSubscribeNoNotify(_PluginBase):
     # 插件名称
@@ -85,7 +850,7 @@ class RssSubscribeNoNotify(_PluginBase):
     # 插件图标
     plugin_icon = "rss.png"
     # 插件版本
-    plugin_version = "2.1.5"
+    plugin_version = "2.2.19"
     # 插件作者
     plugin_author = "jxxghp / misaya"
     # 作者主页
@@ -100,6 +865,60 @@ class RssSubscribeNoNotify(_PluginBase):
     # 私有变量
     _scheduler: Optional[BackgroundScheduler] = None
     _cache_path: Optional[Path] = None
+    # 检查点：每处理多少条RSS项落盘一次刷新进度
+    _checkpoint_batch: int = 20
+    # 检查点有效期（秒），超过后不再续跑
+    _checkpoint_ttl: int = 24 * 3600
+    # 退出事件，每次初始化插件时更换；刷新开始时持有当时的事件，停止插件即中止运行中的刷新和等待
+    _event = Event()
+    _run_event = Event()
+    # 单轮运行状态：是否运行中、运行期间是否有新的触发、本轮截止时间
+    _running: bool = False
+    _pending: bool = False
+    _deadline: float = 0
+    # 历史记录索引及运行期间通过API删除的记录键、去重键
+    _history_index: Optional[_HistoryIndex] = None
+    _deleted_keys: Set[str] = set()
+    _deleted_dedup_keys: Set[str] = set()
+    _history_lock = Lock()
+    # 跨轮复用的下载/订阅链和帮助类
+    _chains: Optional[_ChainContext] = None
+    _chains_lock = Lock()
+    # 识别结果缓存：键 -> (媒体信息, 标题, 副标题)；媒体库存在性缓存：键 -> (存在信息,)
+    _recognize_cache = _TtlCache()
+    _exists_cache = _TtlCache()
+    # 标题解析缓存：(标题, 描述)哈希 -> (元数据,)
+    _meta_cache = _TtlCache()
+    # 按TMDB编号缓存的媒体信息：类型|tmdbid -> (媒体信息,)，供别名索引命中时离线使用
+    _media_cache = _TtlCache()
+    # 媒体库快照索引，按存在性缓存有效期重新加载
+    _library: Optional[_LibraryIndex] = None
+    _library_lock = Lock()
+    # 名称别名索引，首次识别时从存储和历史记录加载
+    _alias_index: Optional[_AliasIndex] = None
+    # 媒体库存在性缓存有效期（秒）
+    _exists_ttl: int = 30 * 60
+    # 拒绝决定的有效期（秒），未列出的阶段在过滤配置不变时一直有效；解析结果随识别词和系统版本变化，也会过期
+    _reject_ttls: Dict[str, int] = {
+        "meta": 6 * 3600,
+        "recognize": 6 * 3600,
+        "exists": 24 * 3600
+    }
+    # 运行指标，进程内累计，通过 /metrics 以 Prometheus 文本格式导出
+    _metrics = _Metrics(prefix="moviepilot_rsssubscribenonotify", definitions={
+        "feed_fetches_total": ("counter", "RSS feed fetches by result."),
+        "feed_fetch_seconds": ("summary", "RSS feed fetch latency in seconds."),
+        "items_total": ("counter", "RSS items by pipeline stage: seen, deduped, rejected, recognized, matched, deferred, acted."),
+        "stage_seconds": ("summary", "Per-item pipeline stage latency in seconds."),
+        "cache_requests_total": ("counter", "Recognition, alias index and media-library cache lookups by result."),
+        "downloader_routes_total": ("counter", "Direct downloads routed to each downloader by reason."),
+        "grab_latency_seconds": ("summary", "Time from release pubdate to a successful direct download in seconds."),
+        "runs_total": ("counter", "Refresh runs by outcome."),
+        "import_seconds": ("gauge", "Module import and chain load time in seconds.")
+    })
+    # 各站点的请求令牌桶
+    _buckets: Dict[str, _TokenBucket] = {}
+    _bucket_lock = Lock()
 
     # 配置属性
     _enabled: bool = False
@@ -116,11 +935,67 @@ class RssSubscribeNoNotify(_PluginBase):
     _action: str = "subscribe"
     _save_path: str = ""
     _size_range: str = ""
+    _max_runtime: int = 30
+    _adaptive: bool = False
+    _poll_min: int = 5
+    _poll_max: int = 360
+    _host_rate: int = 10
+    _fetch_retries: int = 2
+    _fetch_workers: int = 4
+    _breaker_threshold: int = 3
+    _history_limit: int = 1000
+    _max_age: int = 0
+    _watermark: bool = False
+    _cache_ttl: int = 360
+    _warmup: bool = False
+    _warmup_interval: int = 30
+    _alias: bool = False
+    _parse_workers: int = 0
+    _parse_threshold: int = 200
+    # 解析进程池，以 spawn 方式启动并跨轮复用；单批解析超时（秒）后放弃进程池，改为进程内解析
+    _parse_pool: Optional[ProcessPoolExecutor] = None
+    _parse_timeout: int = 120
+    _library_index: bool = False
+    _prefetch: bool = False
+    # 每个源每轮最多预取的种子数，其余仍由下载时获取
+    _prefetch_limit: int = 50
+    # 预取使用独立于RSS刷新的站点令牌桶，允许的突发请求数；令牌不足时不等待，由下载时获取
+    _prefetch_burst: int = 5
+    # 种子缓存保留天数
+    _torrent_keep_days: int = 7
+    _retry_attempts: int = 3
+    # 下载失败首次重试间隔（秒），之后每次翻倍
+    _retry_backoff: int = 10 * 60
+    # 重试和准入队列中已识别的下载上下文，重启后按队列记录重建
+    _retry_contexts: Dict[str, Any] = {}
+    # 下载准入限制，0为不限制
+    _max_per_run: int = 0
+    _max_per_hour: int = 0
+    _max_active: int = 0
+    _min_free_gb: int = 0
+    # 准入队列中等待超过该时间（秒）的项放弃
+    _admission_expire: int = 3 * 24 * 3600
+    # 本轮准入状态：已准入数、已准入大小、活动任务数、剩余空间、最近一小时下载时间
+    _admission: Optional[dict] = None
+    _fresh_first: bool = True
+    # 源权重：RSS地址 -> 权重，未配置的源为1
+    _feed_weights: Dict[str, float] = {}
+    # 本轮下载成功项的发布到下载时延（秒），运行结束时落盘
+    _latencies: List[float] = []
+    _downloaders: List[str] = []
+    # 本轮各下载器的负载快照：名称 -> {active, speed, free}；剧集沿用的下载器：类型|tmdbid -> 名称
+    _downloader_loads: Optional[Dict[str, dict]] = None
+    _routes: Dict[str, str] = {}
+    # qBittorrent 增量同步状态：下载器名称 -> (rid, 剩余空间)，跨轮复用，只拉取变化的部分
+    _maindata_sync: Dict[str, Tuple[int, Optional[float]]] = {}
+    # 解析后的种子大小上下限（字节）
+    _size_bounds: Optional[Tuple[float, float]] = None
 
     def init_plugin(self, config: dict = None):
 
         # 停止现有任务
         self.stop_service()
+        self._event = Event()
 
         # 配置
         if config:
@@ -138,6 +1013,41 @@ class RssSubscribeNoNotify(_PluginBase):
             self._action = config.get("action")
             self._save_path = str(config.get("save_path") or "").strip()
             self._size_range = config.get("size_range")
+            self._max_runtime = self.__to_int(config.get("max_runtime"), 30)
+            self._adaptive = config.get("adaptive", False)
+            self._poll_min = max(1, self.__to_int(config.get("poll_min"), 5))
+            self._poll_max = max(self._poll_min, self.__to_int(config.get("poll_max"), 360))
+            self._host_rate = max(0, self.__to_int(config.get("host_rate"), 10))
+            self._fetch_retries = max(0, self.__to_int(config.get("fetch_retries"), 2))
+            self._fetch_workers = max(1, self.__to_int(config.get("fetch_workers"), 4))
+            self._breaker_threshold = max(0, self.__to_int(config.get("breaker_threshold"), 3))
+            self._history_limit = max(1, self.__to_int(config.get("history_limit"), 1000))
+            self._max_age = max(0, self.__to_int(config.get("max_age"), 0))
+            self._watermark = config.get("watermark", False)
+            self._cache_ttl = max(0, self.__to_int(config.get("cache_ttl"), 360))
+            self._warmup = config.get("warmup", False)
+            self._warmup_interval = max(5, self.__to_int(config.get("warmup_interval"), 30))
+            self._alias = config.get("alias", False)
+            self._parse_workers = max(0, self.__to_int(config.get("parse_workers"), 0))
+            self._parse_threshold = max(1, self.__to_int(config.get("parse_threshold"), 200))
+            self._library_index = config.get("library_index", False)
+            self._prefetch = config.get("prefetch", False)
+            self._retry_attempts = max(0, self.__to_int(config.get("retry_attempts"), 3))
+            self._downloaders = config.get("downloaders") or []
+            self._max_per_run = max(0, self.__to_int(config.get("max_per_run"), 0))
+            self._max_per_hour = max(0, self.__to_int(config.get("max_per_hour"), 0))
+            self._max_active = max(0, self.__to_int(config.get("max_active"), 0))
+            self._min_free_gb = max(0, self.__to_int(config.get("min_free_gb"), 0))
+            self._fresh_first = config.get("fresh_first", True)
+            self._feed_weights = self.__parse_feed_weights(config.get("feed_weights"))
+            self._size_bounds = self.__parse_size_range(self._size_range)
+        self._cache_path = self.get_data_path()
+        self._buckets = {}
+        # 配置变更后重建链路上下文
+        with self._chains_lock:
+            self._chains = None
+        self._exists_cache.clear()
+        self._library = None
 
         if self._onlyonce:
             self._scheduler = BackgroundScheduler(timezone=settings.TZ)
@@ -189,6 +1099,18 @@ class RssSubscribeNoNotify(_PluginBase):
                 "endpoint": self.delete_history,
                 "methods": ["GET"],
                 "summary": "删除自定义订阅无通知历史记录"
+            },
+            {
+                "path": "/delete_histories",
+                "endpoint": self.delete_histories,
+                "methods": ["GET"],
+                "summary": "批量删除自定义订阅无通知历史记录"
+            },
+            {
+                "path": "/metrics",
+                "endpoint": self.metrics,
+                "methods": ["GET"],
+                "summary": "自定义订阅无通知运行指标（Prometheus文本格式）"
             }
         ]
 
@@ -203,28 +1125,53 @@ class RssSubscribeNoNotify(_PluginBase):
             "kwargs": {} # 定时器参数
         }]
         """
-        if self._enabled and self._cron:
-            return [{
+        if not self._enabled:
+            return []
+        if self._adaptive:
+            # 自适应轮询：按最短间隔检查，每个源是否刷新由其自身间隔决定
+            services = [{
+                "id": "RssSubscribeNoNotify",
+                "name": "自定义订阅无通知服务",
+                "trigger": "interval",
+                "func": self.check,
+                "kwargs": {"minutes": self._poll_min}
+            }]
+        elif self._cron:
+            services = [{
                 "id": "RssSubscribeNoNotify",
                 "name": "自定义订阅无通知服务",
                 "trigger": CronTrigger.from_crontab(self._cron),
                 "func": self.check,
                 "kwargs": {}
             }]
-        elif self._enabled:
-            return [{
+        else:
+            services = [{
                 "id": "RssSubscribeNoNotify",
                 "name": "自定义订阅无通知服务",
                 "trigger": "interval",
                 "func": self.check,
                 "kwargs": {"minutes": 30}
             }]
-        return []
+        if self._warmup:
+            services.append({
+                "id": "RssSubscribeNoNotifyWarmup",
+                "name": "自定义订阅无通知缓存预热",
+                "trigger": "interval",
+                "func": self.warmup,
+                "kwargs": {"minutes": self._warmup_interval}
+            })
+        return services
 
     def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
         """
         拼装插件配置页面，需要返回两块数据：1、页面配置；2、数据结构
         """
+        from app.helper.downloader import DownloaderHelper
+
+        downloader_items = [
+            {"title": config.name, "value": config.name}
+            for config in DownloaderHelper().get_configs().values()
+        ]
         return [
             {
                 'component': 'VForm',
@@ -408,6 +1355,28 @@ class RssSubscribeNoNotify(_PluginBase):
                             }
                         ]
                     },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 6
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'max_runtime',
+                                            'label': '单轮最长运行(分钟)',
+                                            'placeholder': '超时中止并在下轮续跑，0为不限制'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
                     {
                         'component': 'VRow',
                         'content': [
@@ -421,23 +1390,25 @@ class RssSubscribeNoNotify(_PluginBase):
                                     {
                                         'component': 'VSwitch',
                                         'props': {
-                                            'model': 'proxy',
-                                            'label': '使用代理服务器',
+                                            'model': 'adaptive',
+                                            'label': '按源自适应刷新间隔',
                                         }
                                     }
                                 ]
-                            }, {
+                            },
+                            {
                                 'component': 'VCol',
                                 'props': {
                                     'cols': 12,
-                                    'md': 4,
+                                    'md': 4
                                 },
                                 'content': [
                                     {
-                                        'component': 'VSwitch',
+                                        'component': 'VTextField',
                                         'props': {
-                                            'model': 'filter',
-                                            'label': '使用MP订阅优先级规则',
+                                            'model': 'poll_min',
+                                            'label': '最短刷新间隔(分钟)',
+                                            'placeholder': '开启自适应后替代执行周期'
                                         }
                                     }
                                 ]
@@ -450,43 +1421,633 @@ class RssSubscribeNoNotify(_PluginBase):
                                 },
                                 'content': [
                                     {
-                                        'component': 'VSwitch',
+                                        'component': 'VTextField',
                                         'props': {
-                                            'model': 'clear',
-                                            'label': '清理历史记录',
+                                            'model': 'poll_max',
+                                            'label': '最长刷新间隔(分钟)',
+                                            'placeholder': '360'
                                         }
                                     }
                                 ]
                             }
                         ]
-                    }
-                ]
-            }
-        ], {
-            "enabled": False,
-            "notify": False,
-            "onlyonce": False,
-            "cron": "*/30 * * * *",
-            "address": "",
-            "include": "",
-            "exclude": "",
-            "proxy": False,
-            "clear": False,
-            "filter": True,
-            "action": "subscribe",
-            "save_path": "",
-            "size_range": ""
-        }
-
-    def get_page(self) -> List[dict]:
-        """
-        拼装插件详情页面，需要返回页面配置，同时附带数据
-        """
-        # 查询同步详情
-        historys = self.get_data('history')
-        if not historys:
-            return [
-                {
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'proxy',
+                                            'label': '使用代理服务器',
+                                        }
+                                    }
+                                ]
+                            }, {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4,
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'filter',
+                                            'label': '使用MP订阅优先级规则',
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'clear',
+                                            'label': '清理历史记录',
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'host_rate',
+                                            'label': '每站点每分钟请求数',
+                                            'placeholder': '同一站点的RSS请求限速，0为不限制'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'fetch_retries',
+                                            'label': '获取失败重试次数',
+                                            'placeholder': '2'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'fetch_workers',
+                                            'label': '并发获取数',
+                                            'placeholder': '4'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'breaker_threshold',
+                                            'label': '连续失败熔断次数',
+                                            'placeholder': '连续失败达到次数后暂停刷新该源，0为不熔断'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'history_limit',
+                                            'label': '保留历史记录数',
+                                            'placeholder': '更早的记录转入布隆过滤器，仍不会重复处理'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 6
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'max_age',
+                                            'label': '最长发布时间(小时)',
+                                            'placeholder': '早于此时间发布的项直接跳过，0为不限制'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 6
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'watermark',
+                                            'label': '跳过早于源水位的项',
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'cache_ttl',
+                                            'label': '识别缓存有效期(分钟)',
+                                            'placeholder': '0为不缓存'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'warmup',
+                                            'label': '空闲时预热识别缓存',
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'warmup_interval',
+                                            'label': '预热间隔(分钟)',
+                                            'placeholder': '30'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'alias',
+                                            'label': '按别名索引识别已知媒体',
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'parse_workers',
+                                            'label': '标题解析进程数',
+                                            'placeholder': '0为不使用多进程'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'parse_threshold',
+                                            'label': '多进程解析阈值(项)',
+                                            'placeholder': '200'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'library_index',
+                                            'label': '按媒体库快照判断是否已存在',
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'prefetch',
+                                            'label': '预取种子文件（仅下载模式）',
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'retry_attempts',
+                                            'label': '下载失败重试次数',
+                                            'placeholder': '0为不重试'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 12
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSelect',
+                                        'props': {
+                                            'model': 'downloaders',
+                                            'label': '直接下载使用的下载器',
+                                            'multiple': True,
+                                            'chips': True,
+                                            'clearable': True,
+                                            'items': downloader_items
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 3
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'max_per_run',
+                                            'label': '每轮最多下载',
+                                            'placeholder': '0为不限制'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 3
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'max_per_hour',
+                                            'label': '每小时最多下载',
+                                            'placeholder': '0为不限制'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 3
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'max_active',
+                                            'label': '最多活动任务',
+                                            'placeholder': '0为不限制'
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 3
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextField',
+                                        'props': {
+                                            'model': 'min_free_gb',
+                                            'label': '最少剩余空间（GB）',
+                                            'placeholder': '0为不检查'
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'VRow',
+                        'content': [
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 4
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VSwitch',
+                                        'props': {
+                                            'model': 'fresh_first',
+                                            'label': '跨源按发布时间从新到旧处理',
+                                        }
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VCol',
+                                'props': {
+                                    'cols': 12,
+                                    'md': 8
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VTextarea',
+                                        'props': {
+                                            'model': 'feed_weights',
+                                            'label': '源权重',
+                                            'placeholder': '每行一个：RSS地址|权重，权重越大越优先',
+                                            'rows': 2
+                                        }
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            }
+        ], {
+            "enabled": False,
+            "notify": False,
+            "onlyonce": False,
+            "cron": "*/30 * * * *",
+            "address": "",
+            "include": "",
+            "exclude": "",
+            "proxy": False,
+            "clear": False,
+            "filter": True,
+            "action": "subscribe",
+            "save_path": "",
+            "size_range": "",
+            "max_runtime": 30,
+            "adaptive": False,
+            "poll_min": 5,
+            "poll_max": 360,
+            "host_rate": 10,
+            "fetch_retries": 2,
+            "fetch_workers": 4,
+            "breaker_threshold": 3,
+            "history_limit": 1000,
+            "max_age": 0,
+            "watermark": False,
+            "cache_ttl": 360,
+            "warmup": False,
+            "warmup_interval": 30,
+            "alias": False,
+            "parse_workers": 0,
+            "parse_threshold": 200,
+            "library_index": False,
+            "prefetch": False,
+            "retry_attempts": 3,
+            "downloaders": [],
+            "max_per_run": 0,
+            "max_per_hour": 0,
+            "max_active": 0,
+            "min_free_gb": 0,
+            "fresh_first": True,
+            "feed_weights": ""
+        }
+
+    def get_page(self) -> List[dict]:
+        """
+        拼装插件详情页面，需要返回页面配置，同时附带数据
+        """
+        # 运行统计
+        run_stats = self.get_data('run_stats') or {}
+        stats_components = [
+            {
+                'component': 'VAlert',
+                'props': {
+                    'type': 'info',
+                    'variant': 'tonal',
+                    'class': 'mb-3',
+                    'text': f"运行中合并的触发：{run_stats.get('skipped', 0)} 次，"
+                            f"合并补跑：{run_stats.get('coalesced', 0)} 次，"
+                            f"超时中止：{run_stats.get('timeouts', 0)} 次，"
+                            f"模块导入：{_import_timings.get('module', 0) * 1000:.1f} ms，"
+                            f"链路加载：{_import_timings.get('chains', 0) * 1000:.1f} ms"
+                }
+            }
+        ]
+        # 下载器分配统计
+        route_stats = self.get_data('route_stats') or {}
+        if route_stats:
+            stats_components.append({
+                'component': 'VAlert',
+                'props': {
+                    'type': 'info',
+                    'variant': 'tonal',
+                    'class': 'mb-3',
+                    'text': "下载器分配：" + "，".join(f"{name} {count} 次" for name, count in route_stats.items())
+                }
+            })
+        # 发布到下载时延
+        latencies = sorted(self.get_data('grab_latency') or [])
+        if latencies:
+            p50 = latencies[int(len(latencies) * 0.5)]
+            p90 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]
+            stats_components.append({
+                'component': 'VAlert',
+                'props': {
+                    'type': 'info',
+                    'variant': 'tonal',
+                    'class': 'mb-3',
+                    'text': f"最近 {len(latencies)} 次下载的发布到下载时延：p50 {p50 / 60:.1f} 分钟，"
+                            f"p90 {p90 / 60:.1f} 分钟"
+                }
+            })
+        admission_queue = self.get_data('admission_queue') or {}
+        if admission_queue:
+            stats_components.append({
+                'component': 'VAlert',
+                'props': {
+                    'type': 'warning',
+                    'variant': 'tonal',
+                    'class': 'mb-3',
+                    'text': f"下载准入队列：{len(admission_queue)} 项等待后续轮次下载"
+                }
+            })
+        stats_components += self.__feed_health_components()
+        # 查询同步详情
+        historys = self.get_data('history')
+        if not historys:
+            return stats_components + [
+                {
                     'component': 'div',
                     'text': '暂无数据',
                     'props': {
@@ -575,233 +2136,1761 @@ class RssSubscribeNoNotify(_PluginBase):
                         }
                     ]
                 }
-            )
+            )
+
+        return stats_components + [
+            {
+                'component': 'div',
+                'props': {
+                    'class': 'grid gap-3 grid-info-card',
+                },
+                'content': contents
+            }
+        ]
+
+    def __feed_health_components(self) -> List[dict]:
+        """
+        拼装各RSS源的健康状况表
+        """
+        feed_state: Dict[str, dict] = self.get_data('feed_state') or {}
+        if not feed_state:
+            return []
+        now = time.time()
+        rows = []
+        for url, state in feed_state.items():
+            # 只显示站点和路径，避免在页面上暴露passkey等参数
+            parsed = urlparse(url)
+            if self.__is_breaker_open(state):
+                status = "熔断"
+            elif self._breaker_threshold and state.get("failures", 0) >= self._breaker_threshold:
+                status = "待试探"
+            elif state.get("failures"):
+                status = "失败"
+            else:
+                status = "正常"
+            if status == "熔断":
+                next_poll = state.get("open_until")
+            else:
+                next_poll = state.get("next_poll") if self._adaptive else None
+            cells = [
+                f"{parsed.netloc}{parsed.path}",
+                status,
+                f"{state.get('success', 0)}/{state.get('failure', 0)}",
+                state.get("failures", 0),
+                f"{state.get('avg_latency', 0)} ms",
+                state.get("items", 0),
+                f"{max(0, int((next_poll - now) / 60))} 分钟后" if next_poll else "-"
+            ]
+            rows.append({
+                'component': 'tr',
+                'content': [
+                    {
+                        'component': 'td',
+                        'props': {
+                            'class': 'ps-4'
+                        },
+                        'text': cell
+                    } for cell in cells
+                ]
+            })
+        headers = ["RSS", "状态", "成功/失败", "连续失败", "平均耗时", "最近项数", "下次刷新"]
+        return [
+            {
+                'component': 'VTable',
+                'props': {
+                    'hover': True,
+                    'class': 'mb-3'
+                },
+                'content': [
+                    {
+                        'component': 'thead',
+                        'content': [
+                            {
+                                'component': 'tr',
+                                'content': [
+                                    {
+                                        'component': 'th',
+                                        'props': {
+                                            'class': 'text-start ps-4'
+                                        },
+                                        'text': header
+                                    } for header in headers
+                                ]
+                            }
+                        ]
+                    },
+                    {
+                        'component': 'tbody',
+                        'content': rows
+                    }
+                ]
+            }
+        ]
+
+    def stop_service(self):
+        """
+        退出插件
+        """
+        try:
+            self._event.set()
+            self.__shutdown_parse_pool()
+            if self._scheduler:
+                self._scheduler.remove_all_jobs()
+                if self._scheduler.running:
+                    self._scheduler.shutdown()
+                self._scheduler = None
+        except Exception as e:
+            logger.error("退出插件失败：%s" % str(e))
+
+    def delete_history(self, key: str, apikey: str):
+        """
+        删除同步历史记录
+        """
+        if apikey != settings.API_TOKEN:
+            return schemas.Response(success=False, message="API密钥错误")
+        # 删除指定记录
+        deleted, remaining = self.__delete_history_records(titles=[key])
+        if not deleted and not remaining:
+            return schemas.Response(success=False, message="未找到历史记录")
+        return schemas.Response(success=True, message="删除成功")
+
+    def delete_histories(self, apikey: str, keys: Optional[str] = None, title: Optional[str] = None,
+                         mtype: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None):
+        """
+        批量删除历史记录，各条件同时生效
+        :param keys: 记录键（RSS标题），多个用换行分隔
+        :param title: 标题正则，匹配显示标题或RSS标题
+        :param mtype: 媒体类型，如 电影、电视剧
+        :param start: 开始时间，如 2024-01-01 或 2024-01-01 08:00:00
+        :param end: 结束时间，只写日期时包含当天
+        """
+        if apikey != settings.API_TOKEN:
+            return schemas.Response(success=False, message="API密钥错误")
+        if not any([keys, title, mtype, start, end]):
+            return schemas.Response(success=False, message="未指定删除条件")
+        try:
+            pattern = re.compile(title, re.IGNORECASE) if title else None
+        except re.error as err:
+            return schemas.Response(success=False, message=f"标题正则错误：{str(err)}")
+        if end and len(end) == 10:
+            end = f"{end} 23:59:59"
+        deleted, remaining = self.__delete_history_records(
+            keys=[key.strip() for key in keys.splitlines() if key.strip()] if keys else None,
+            pattern=pattern,
+            mtype=mtype,
+            start=start,
+            end=end
+        )
+        return schemas.Response(success=True, message=f"已删除 {deleted} 条历史记录",
+                                data={"deleted": deleted, "remaining": remaining})
+
+    def metrics(self, apikey: str):
+        """
+        以 Prometheus 文本格式导出运行指标
+        """
+        from fastapi.responses import PlainTextResponse
+
+        if apikey != settings.API_TOKEN:
+            return schemas.Response(success=False, message="API密钥错误")
+        for phase, seconds in _import_timings.items():
+            self._metrics.set("import_seconds", seconds, phase=phase)
+        return PlainTextResponse(self._metrics.render(), media_type="text/plain; version=0.0.4")
+
+    def __delete_history_records(self, **conditions) -> Tuple[int, int]:
+        """
+        按索引删除匹配的历史记录，返回删除数和剩余数
+        """
+        with self._history_lock:
+            if self._history_index is None:
+                self._history_index = _HistoryIndex(self.get_data('history') or [])
+            index = self._history_index
+            selected = index.select(**conditions)
+            if not selected:
+                return 0, len(index.records)
+            records = [record for i, record in enumerate(index.records) if i not in selected]
+            self.save_data('history', records)
+            self._history_index = _HistoryIndex(records)
+            # 删除记录后允许重新获取同一发布，清除其去重键；早期记录没有保存去重键，按标题重新计算
+            dedup_keys = [key for i in selected
+                          for key in index.records[i].get("dedup_keys")
+                          or _DedupIndex.item_keys(title=index.records[i].get("key") or "", enclosure=None, link=None)]
+            if dedup_keys:
+                dedup = _DedupIndex(keys=self.get_data('dedup_index') or {})
+                dedup.remove(dedup_keys)
+                self.save_data('dedup_index', dedup.to_dict())
+            if self._running:
+                # 刷新进行中，保存时剔除这些记录和去重键，避免被本轮刷新写回
+                self._deleted_keys |= {index.records[i].get("key") for i in selected}
+                self._deleted_dedup_keys |= set(dedup_keys)
+            return len(selected), len(records)
+
+    def __save_history(self, history: List[dict]) -> List[dict]:
+        """
+        保存历史记录，剔除刷新期间通过API删除的记录
+        """
+        with self._history_lock:
+            if self._deleted_keys:
+                history = [h for h in history if h.get("key") not in self._deleted_keys]
+            self.save_data('history', history)
+            self._history_index = None
+        return history
+
+    def __save_dedup(self, dedup: _DedupIndex):
+        """
+        保存去重索引，剔除刷新期间随历史记录删除的去重键
+        """
+        with self._history_lock:
+            if self._deleted_dedup_keys:
+                dedup.remove(list(self._deleted_dedup_keys))
+            self.save_data('dedup_index', dedup.to_dict())
+
+    def __update_config(self):
+        """
+        更新设置
+        """
+        self.update_config({
+            "enabled": self._enabled,
+            "notify": False,
+            "onlyonce": self._onlyonce,
+            "cron": self._cron,
+            "address": self._address,
+            "include": self._include,
+            "exclude": self._exclude,
+            "proxy": self._proxy,
+            "clear": self._clear,
+            "filter": self._filter,
+            "action": self._action,
+            "save_path": self._save_path,
+            "size_range": self._size_range,
+            "max_runtime": self._max_runtime,
+            "adaptive": self._adaptive,
+            "poll_min": self._poll_min,
+            "poll_max": self._poll_max,
+            "host_rate": self._host_rate,
+            "fetch_retries": self._fetch_retries,
+            "fetch_workers": self._fetch_workers,
+            "breaker_threshold": self._breaker_threshold,
+            "history_limit": self._history_limit,
+            "max_age": self._max_age,
+            "watermark": self._watermark,
+            "cache_ttl": self._cache_ttl,
+            "warmup": self._warmup,
+            "warmup_interval": self._warmup_interval,
+            "alias": self._alias,
+            "parse_workers": self._parse_workers,
+            "parse_threshold": self._parse_threshold,
+            "library_index": self._library_index,
+            "prefetch": self._prefetch,
+            "retry_attempts": self._retry_attempts,
+            "downloaders": self._downloaders,
+            "max_per_run": self._max_per_run,
+            "max_per_hour": self._max_per_hour,
+            "max_active": self._max_active,
+            "min_free_gb": self._min_free_gb,
+            "fresh_first": self._fresh_first,
+            "feed_weights": self.__feed_weights_text()
+        })
+
+    def check(self):
+        """
+        刷新RSS，同一时间只运行一轮，运行期间到达的触发合并为一次补跑
+        """
+        with lock:
+            if self._running:
+                self._pending = True
+                self.__count_run_stat("skipped")
+                logger.info("自定义订阅无通知：上一轮刷新仍在运行，本次触发已合并")
+                return
+            self._running = True
+            self._pending = False
+            self._run_event = self._event
+        try:
+            while True:
+                self.__check()
+                with lock:
+                    if not self._pending or self._run_event.is_set():
+                        return
+                    self._pending = False
+                self.__count_run_stat("coalesced")
+                logger.info("自定义订阅无通知：执行运行期间合并的刷新触发")
+        finally:
+            with lock:
+                self._running = False
+            with self._history_lock:
+                self._deleted_keys = set()
+                self._deleted_dedup_keys = set()
+
+    def __check(self):
+        """
+        通过用户RSS同步豆瓣想看数据
+        """
+        from app.core.context import MediaInfo, TorrentInfo, Context
+
+        if not self._address:
+            return
+        self._deadline = time.time() + self._max_runtime * 60 if self._max_runtime > 0 else 0
+        # 读取历史记录
+        if self._clearflag:
+            history = []
+            checkpoint = self.__new_checkpoint()
+        else:
+            history: List[dict] = self.get_data('history') or []
+            checkpoint = self.__load_checkpoint()
+        history_keys = {h.get("key") for h in history}
+        # 超出保留数量的历史记录只保留在布隆过滤器中
+        seen_path = self._cache_path / "seen.bloom"
+        try:
+            seen = _ScalableBloomFilter() if self._clearflag else _ScalableBloomFilter.load(seen_path)
+        except Exception as err:
+            logger.error(f"读取历史记录过滤器失败：{str(err)}")
+            seen = _ScalableBloomFilter()
+        # 跨源去重索引，清理历史记录时一并清空
+        dedup = _DedupIndex(keys={} if self._clearflag else self.get_data('dedup_index') or {})
+        # 拒绝缓存：过滤配置未变化时，之前被拒绝的项直接跳过
+        filter_groups = self.systemconfig.get(SystemConfigKey.SubscribeFilterRuleGroups)
+        version = self.__decision_version(filter_groups)
+        rejections = _RejectionCache(entries={} if self._clearflag else self.get_data('rejections') or {},
+                                     ttls=self._reject_ttls)
+        pending = 0
+        # 各RSS源的刷新状态，只保留仍在配置中的源
+        saved_state: Dict[str, dict] = self.get_data('feed_state') or {}
+        feed_state: Dict[str, dict] = {}
+        chains = self.__chain_context()
+        downloadchain = chains.downloadchain
+        subscribechain = chains.subscribechain
+        rulehelper = chains.rulehelper
+        # 订阅模式下一次性加载现有订阅，本轮新订阅在检查点落盘前批量添加
+        subscriptions = self.__load_subscriptions() if self._action != "download" else None
+        new_subscribes: List[Tuple[dict, dict, List[str], dict, Any]] = []
+        # 下载失败的重试队列，到期项直接进入下载阶段
+        retry_queue: Dict[str, dict] = {} if self._clearflag else self.get_data('retry_queue') or {}
+        # 超过准入限制的项，按优先级在后续轮次准入
+        admission_queue: Dict[str, dict] = {} if self._clearflag else self.get_data('admission_queue') or {}
+        if self._clearflag:
+            self._retry_contexts.clear()
+        # 下载器负载和准入状态每轮重新采集，剧集沿用的下载器持久保存
+        self._downloader_loads = None
+        self._admission = None
+        self._latencies = []
+        self._routes = self.get_data('downloader_routes') or {}
+        if retry_queue and self._action == "download":
+            history = self.__retry_downloads(retry_queue=retry_queue, downloadchain=downloadchain,
+                                             history=history, history_keys=history_keys, dedup=dedup)
+        if admission_queue and self._action == "download":
+            history = self.__drain_admission(admission_queue=admission_queue, retry_queue=retry_queue,
+                                             downloadchain=downloadchain, history=history,
+                                             history_keys=history_keys, dedup=dedup)
+        # 本轮需要刷新的RSS链接，熔断后试探的源只请求一次
+        urls = []
+        probes = set()
+        for url in self._address.splitlines():
+            url = url.strip()
+            if not url or url in feed_state:
+                continue
+            state = feed_state[url] = saved_state.get(url) or {}
+            if self._adaptive and time.time() < state.get("next_poll", 0):
+                logger.debug(f"RSS {url} 未到刷新时间，跳过")
+                continue
+            if self.__is_breaker_open(state):
+                logger.info(f"RSS {url} 连续失败 {state.get('failures')} 次，熔断中，跳过")
+                continue
+            if self._breaker_threshold and state.get("failures", 0) >= self._breaker_threshold:
+                logger.info(f"RSS {url} 熔断到期，试探刷新")
+                probes.add(url)
+            urls.append(url)
+        feeds = self.__fetch_feeds(urls, probes=probes)
+        # 各源本轮的处理状态，全部项处理完成的源才推进水位
+        batches: Dict[str, dict] = {}
+        # 跨源的待处理项：(排序键, RSS地址, 项)
+        queue: List[Tuple[float, str, dict]] = []
+        # 本轮已预取的发布，跨源转发的同一发布只预取一次
+        prefetched: Set[str] = set()
+        for url in urls:
+            if self.__is_aborted():
+                break
+            # 处理每一个RSS链接
+            state = feed_state[url]
+            results, latency = feeds.get(url) or (None, 0)
+            self.__record_feed_health(state=state, results=results, latency=latency)
+            if results is None or results is False:
+                logger.error(f"未获取到RSS数据：{url}")
+                state["next_poll"] = time.time() + self._poll_min * 60
+                continue
+            self.__update_poll_interval(state=state, results=results)
+            if not results:
+                logger.info(f"RSS {url} 暂无条目")
+                continue
+            self._metrics.inc("items_total", len(results), stage="seen")
+            # 本源最新的发布时间，整源处理完成后作为水位，不超过当前时间
+            newest = max((r.get("pubdate").timestamp() for r in results
+                          if isinstance(r.get("pubdate"), datetime.datetime)), default=None)
+            if newest:
+                newest = min(newest, time.time())
+            # 数值条件预筛
+            results = self.__numeric_prefilter(results=results,
+                                               watermark=state.get("watermark") if self._watermark else None)
+            # 本源在上次中断的刷新中已处理过的项
+            processed: List[str] = checkpoint["feeds"].setdefault(url, [])
+            processed_keys = set(processed)
+            # 本轮尚未处理、未归档、未被拒绝的项
+            fresh = [r for r in results
+                     if r.get("title") and r.get("title") not in processed_keys
+                     and r.get("title") not in history_keys and r.get("title") not in seen
+                     and r.get("title") not in retry_queue and r.get("title") not in admission_queue
+                     and not rejections.find(r.get("title"), version)]
+            # 待处理项较多时批量解析标题
+            with self._metrics.timer("stage_seconds", stage="parse_batch"):
+                metas = self.__parse_batch([(r.get("title"), r.get("description")) for r in fresh])
+            # 下载模式下并发预取通过包含/排除规则的项的种子文件
+            with self._metrics.timer("stage_seconds", stage="prefetch"):
+                torrents = self.__prefetch_torrents(fresh, dedup=dedup, prefetched=prefetched) \
+                    if self._prefetch and self._action == "download" else {}
+            batches[url] = {
+                "state": state,
+                "newest": newest,
+                "processed": processed,
+                "processed_keys": processed_keys,
+                "metas": metas,
+                "torrents": torrents,
+                "total": len(results),
+                "done": 0,
+                "unsettled": None
+            }
+            weight = self._feed_weights.get(url, 1)
+            queue.extend((self.__freshness(result.get("pubdate"), weight), url, result) for result in results)
+        # 新发布不必排在其它源的旧项和耗时的识别之后，按新鲜度跨源处理；同新鲜度保持源和源内顺序
+        if self._fresh_first:
+            queue.sort(key=lambda item: item[0])
+        # 解析数据
+        for _, url, result in queue:
+            if self.__is_aborted():
+                break
+            batch = batches[url]
+            batch["done"] += 1
+            processed, processed_keys = batch["processed"], batch["processed_keys"]
+            metas, torrents = batch["metas"], batch["torrents"]
+            title = result.get("title")
+            pubdate: datetime.datetime = result.get("pubdate")
+            if title and title in processed_keys:
+                continue
+            # 是否得出最终结果：已执行动作、已处理过，或在没有有效期的阶段被拒绝
+            settled = True
+            try:
+                description = result.get("description")
+                enclosure = result.get("enclosure")
+                link = result.get("link")
+                size = result.get("size")
+                # 检查是否处理过
+                if not title:
+                    continue
+                if title in history_keys or title in seen:
+                    self._metrics.inc("items_total", stage="deduped")
+                    continue
+                # 检查其它源或其它标题是否已处理过同一发布
+                dedup_keys = dedup.item_keys(title=title, enclosure=enclosure, link=link)
+                duplicate = dedup.find(dedup_keys)
+                if duplicate:
+                    logger.info(f"{title} - 与已处理的发布重复：{duplicate}")
+                    self._metrics.inc("items_total", stage="deduped")
+                    continue
+                if title in retry_queue:
+                    logger.debug(f"{title} - 在下载重试队列中，跳过")
+                    settled = False
+                    continue
+                if title in admission_queue:
+                    logger.debug(f"{title} - 在下载准入队列中，跳过")
+                    settled = False
+                    continue
+                rejected = rejections.find(title, version)
+                if rejected:
+                    settled = rejected not in self._reject_ttls
+                    logger.debug(f"{title} - 此前已在 {rejected} 阶段被拒绝，过滤配置未变化，跳过")
+                    self._metrics.inc("items_total", stage="rejected")
+                    continue
+                # 检查规则
+                if self._include and not re.search(r"%s" % self._include,
+                                                   f"{title} {description}", re.IGNORECASE):
+                    logger.info(f"{title} - {description} 不符合包含规则")
+                    rejections.add(title, "include", version)
+                    continue
+                if self._exclude and re.search(r"%s" % self._exclude,
+                                               f"{title} {description}", re.IGNORECASE):
+                    logger.info(f"{title} - {description} 不符合排除规则")
+                    rejections.add(title, "exclude", version)
+                    continue
+                # 按预取的种子信息去重并校验实际大小
+                torrent = torrents.get(enclosure) if enclosure else None
+                if torrent:
+                    hash_key = f"hash:{torrent['info_hash']}"
+                    if dedup.find([hash_key]):
+                        logger.info(f"{title} - 与已处理的发布重复：{hash_key}")
+                        self._metrics.inc("items_total", stage="deduped")
+                        continue
+                    if hash_key not in dedup_keys:
+                        dedup_keys.append(hash_key)
+                    if self._size_bounds and not self._size_bounds[0] <= torrent["size"] <= self._size_bounds[1]:
+                        logger.info(f"{title} - 种子实际大小 {torrent['size']} 不在范围内")
+                        rejections.add(title, "size", version)
+                        continue
+                # 识别媒体信息
+                with self._metrics.timer("stage_seconds", stage="parse"):
+                    meta = self.__parse_meta(title=title, subtitle=description, parsed=metas)
+                if not meta.name:
+                    logger.warn(f"{title} 未识别到有效数据")
+                    rejections.add(title, "meta", version)
+                    continue
+                with self._metrics.timer("stage_seconds", stage="recognize"):
+                    mediainfo: MediaInfo = self.__recognize(meta=meta, title=title, subtitle=description)
+                if not mediainfo:
+                    logger.warn(f'未识别到媒体信息，标题：{title}')
+                    rejections.add(title, "recognize", version)
+                    settled = False
+                    continue
+                self._metrics.inc("items_total", stage="recognized")
+                # 种子
+                torrentinfo = TorrentInfo(
+                    title=title,
+                    description=description,
+                    enclosure=enclosure,
+                    page_url=link,
+                    size=size,
+                    pubdate=pubdate.strftime("%Y-%m-%d %H:%M:%S") if pubdate else None,
+                    site_proxy=self._proxy,
+                )
+                # 过滤种子
+                if self._filter:
+                    active_groups = rulehelper.get_rule_group_by_media(
+                        media=mediainfo,
+                        group_names=filter_groups
+                    )
+                    active_group_names = [group.name for group in active_groups]
+                    media_category = mediainfo.category or "未分类"
+                    if not active_group_names:
+                        logger.info(
+                            f"{title} - 未匹配到适用订阅规则组，"
+                            f"类型：{mediainfo.type.value}，分类：{media_category}"
+                        )
+                        rejections.add(title, "rule_group", version)
+                        continue
+                    logger.info(
+                        f"{title} - 使用订阅规则组：{', '.join(active_group_names)}，"
+                        f"类型：{mediainfo.type.value}，分类：{media_category}"
+                    )
+                    with self._metrics.timer("stage_seconds", stage="filter"):
+                        matched_torrents = self.chain.filter_torrents(
+                            rule_groups=filter_groups,
+                            torrent_list=[torrentinfo],
+                            mediainfo=mediainfo
+                        )
+                    if not matched_torrents:
+                        logger.info(f"{title} - 不匹配订阅规则组：{', '.join(active_group_names)}")
+                        rejections.add(title, "filter", version)
+                        continue
+                    torrentinfo = matched_torrents[0]
+                    logger.info(
+                        f"{title} - 已命中订阅规则组：{', '.join(active_group_names)}，"
+                        f"优先级：{getattr(torrentinfo, 'pri_order', '-')}"
+                    )
+                # 媒体库已存在的电影或剧集
+                with self._metrics.timer("stage_seconds", stage="exists"):
+                    exists = self.__in_library(mediainfo=mediainfo, meta=meta)
+                if exists:
+                    if mediainfo.type == MediaType.TV:
+                        logger.info(f'{mediainfo.title_year} {meta.season_episode} 己存在')
+                    else:
+                        logger.info(f'{mediainfo.title_year} 己存在')
+                    rejections.add(title, "exists", version)
+                    settled = False
+                    continue
+                self._metrics.inc("items_total", stage="matched")
+                # 下载或订阅
+                action_started = time.perf_counter()
+                if self._action == "download":
+                    # 添加下载
+                    context = Context(
+                        meta_info=meta,
+                        media_info=mediainfo,
+                        torrent_info=torrentinfo,
+                    )
+                    torrent_size = torrent["size"] if torrent else size
+                    downloader = self.__route_downloader(mediainfo=mediainfo, size=torrent_size)
+                    blocked = self.__admission_blocked(size=torrent_size, downloader=downloader)
+                    if blocked:
+                        self.__queue_admission(admission_queue=admission_queue, key=title, context=context,
+                                               dedup_keys=dedup_keys, torrent=torrent, reason=blocked)
+                        settled = False
+                        continue
+                    downloaded = downloadchain.download_single(
+                        context=context,
+                        save_path=self._save_path or None,
+                        username="RSS订阅无通知",
+                        downloader=downloader,
+                        **self.__torrent_kwargs(downloadchain, torrent)
+                    )
+                    if not downloaded:
+                        logger.error(f'{title} 下载失败')
+                        self.__queue_retry(retry_queue=retry_queue, key=title, context=context,
+                                           dedup_keys=dedup_keys, torrent=torrent)
+                        settled = False
+                        continue
+                    self.__record_route(mediainfo=mediainfo, name=downloader, size=torrent_size)
+                    self.__admit()
+                    subscribe = None
+                else:
+                    # 检查是否在订阅中
+                    if subscriptions is not None:
+                        subflag = subscriptions.exists(mediainfo.tmdb_id, mediainfo.douban_id, meta.begin_season)
+                    else:
+                        subflag = subscribechain.exists(mediainfo=mediainfo, meta=meta)
+                    if subflag:
+                        logger.info(f'{mediainfo.title_year} {meta.season} 正在订阅中')
+                        continue
+                    # 添加订阅
+                    subscribe = dict(title=mediainfo.title,
+                                     year=mediainfo.year,
+                                     mtype=mediainfo.type,
+                                     tmdbid=mediainfo.tmdb_id,
+                                     season=meta.begin_season,
+                                     exist_ok=True,
+                                     message=False,
+                                     username="RSS订阅无通知")
+                    if subscriptions is not None:
+                        subscriptions.add(mediainfo.tmdb_id, mediainfo.douban_id, meta.begin_season)
+                # 历史记录
+                record = self.__history_record(key=title, mediainfo=mediainfo, meta=meta, dedup_keys=dedup_keys)
+                if subscribe:
+                    # 新订阅在检查点落盘前批量添加，添加成功后再写历史记录
+                    new_subscribes.append((subscribe, record, dedup_keys, batch, pubdate))
+                    continue
+                self._metrics.observe("stage_seconds", time.perf_counter() - action_started, stage="action")
+                self._metrics.inc("items_total", stage="acted")
+                self.__record_latency(pubdate)
+                history.append(record)
+                history_keys.add(title)
+                dedup.add(dedup_keys)
+                # 已执行动作的项立即落盘，避免中断后重复下载或订阅
+                history = self.__save_history(history)
+                self.__save_dedup(dedup)
+            except Exception as err:
+                logger.error(f'刷新RSS数据出错：{str(err)} - {traceback.format_exc()}')
+                settled = False
+            finally:
+                if title:
+                    if settled:
+                        processed.append(title)
+                        processed_keys.add(title)
+                    else:
+                        self.__unsettle(batch=batch, title=title, pubdate=pubdate)
+                    pending += 1
+                    if pending >= self._checkpoint_batch:
+                        history = self.__add_subscribes(subscribechain, new_subscribes, history,
+                                                        history_keys, dedup)
+                        self.save_data('checkpoint', checkpoint)
+                        pending = 0
+        history = self.__add_subscribes(subscribechain, new_subscribes, history, history_keys, dedup)
+        self.save_data('checkpoint', checkpoint)
+        for url, batch in batches.items():
+            if batch["done"] < batch["total"]:
+                continue
+            if batch["newest"]:
+                # 水位不越过未得出最终结果的项，下一轮仍会处理
+                mark = min(batch["newest"], batch["unsettled"]) if batch["unsettled"] else batch["newest"]
+                batch["state"]["watermark"] = max(batch["state"].get("watermark") or 0, mark)
+            logger.info(f"RSS {url} 刷新完成")
+        # 保存历史记录
+        history = self.__archive_history(history=history, seen=seen, seen_path=seen_path)
+        self.__save_history(history)
+        self.__save_dedup(dedup)
+        self.save_data('rejections', rejections.to_dict())
+        self.save_data('feed_state', feed_state)
+        self.__save_alias_index()
+        if self._prefetch:
+            self.__prune_torrents()
+        if self._latencies:
+            # 只保留最近的时延记录
+            self.save_data('grab_latency', ((self.get_data('grab_latency') or []) + self._latencies)[-500:])
+        if self._routes:
+            # 只保留最近分配的剧集
+            self.save_data('downloader_routes', dict(list(self._routes.items())[-2000:]))
+        for cache in (self._meta_cache, self._recognize_cache, self._exists_cache, self._media_cache):
+            cache.prune()
+        # 缓存只清理一次
+        self._clearflag = False
+        if self.__is_aborted():
+            # 保留检查点，下一轮从中断处续跑
+            if not self._run_event.is_set():
+                self.__count_run_stat("timeouts")
+                logger.warn(f"自定义订阅无通知：刷新超过 {self._max_runtime} 分钟，已中止，下一轮续跑")
+            return
+        # 本轮刷新完成，清除检查点
+        self.save_data('checkpoint', {})
+        self._metrics.inc("runs_total", outcome="completed")
+
+    @staticmethod
+    def __meta_key(title: str, subtitle: Optional[str]) -> str:
+        return hashlib.blake2b(f"{title}\0{subtitle or ''}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def __parse_batch(self, pairs: List[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """
+        批量解析标题：未缓存的项数达到阈值且配置了解析进程数时，分块交给进程池解析，
+        结果按 (标题, 描述) 哈希缓存；未达阈值时返回空，由逐项解析处理
+        """
+        if not self._parse_workers or len(pairs) < self._parse_threshold:
+            return {}
+        missing: Dict[str, Tuple[str, Optional[str]]] = {}
+        for title, subtitle in pairs:
+            key = self.__meta_key(title, subtitle)
+            if key not in missing and not self._meta_cache.get(key):
+                missing[key] = (title, subtitle)
+        if len(missing) < self._parse_threshold:
+            return {}
+        keys = list(missing.keys())
+        items = list(missing.values())
+        # 每个进程分到若干块，均衡各块耗时差异
+        size = max(1, math.ceil(len(items) / (self._parse_workers * 4)))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        started = time.perf_counter()
+        try:
+            # 宿主进程为多线程，fork 可能复制其它线程持有的锁导致子进程死锁，使用 spawn 启动
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self._parse_workers,
+                                                       mp_context=multiprocessing.get_context("spawn"))
+            futures = [self._parse_pool.submit(_parse_titles, chunk) for chunk in chunks]
+            deadline = time.monotonic() + self._parse_timeout
+            metas = [meta for future in futures
+                     for meta in future.result(timeout=max(0.0, deadline - time.monotonic()))]
+        except Exception as err:
+            logger.warn(f"多进程解析标题失败或超时，改为逐项解析：{str(err) or type(err).__name__}")
+            self.__shutdown_parse_pool()
+            return {}
+        logger.info(f"自定义订阅无通知：{self._parse_workers} 个进程解析 {len(metas)} 个标题，"
+                    f"耗时 {(time.perf_counter() - started) * 1000:.0f} ms")
+        parsed = dict(zip(keys, metas))
+        if self._cache_ttl:
+            for key, meta in parsed.items():
+                self._meta_cache.set(key, (meta,), self._cache_ttl * 60)
+        return parsed
+
+    def __shutdown_parse_pool(self):
+        """
+        关闭解析进程池，不等待未完成的解析
+        """
+        pool, self._parse_pool = self._parse_pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def __parse_meta(self, title: str, subtitle: Optional[str], parsed: Dict[str, Any]) -> Any:
+        """
+        解析标题，依次使用本批结果、解析缓存，最后进程内解析；返回副本，避免后续处理改动缓存
+        """
+        from app.core.metainfo import MetaInfo
+
+        key = self.__meta_key(title, subtitle)
+        meta = parsed.get(key)
+        if meta is None:
+            cached = self._meta_cache.get(key)
+            meta = cached[0] if cached else None
+        if meta is None:
+            meta = MetaInfo(title=title, subtitle=subtitle)
+            if self._cache_ttl:
+                self._meta_cache.set(key, (meta,), self._cache_ttl * 60)
+        return copy.deepcopy(meta)
+
+    def __decision_version(self, filter_groups: Optional[List[str]]) -> str:
+        """
+        过滤配置的哈希：包含/排除规则、大小范围、发布时间、规则组及其定义、自定义识别词，任一变化时拒绝缓存失效
+        """
+        rule_groups = self.systemconfig.get(SystemConfigKey.UserFilterRuleGroups) if self._filter else None
+        identifiers = self.systemconfig.get(SystemConfigKey.CustomIdentifiers)
+        payload = json.dumps([self._include, self._exclude, self._size_range, self._max_age,
+                              self._filter, filter_groups, rule_groups, identifiers],
+                             ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()[:16]
+
+    def warmup(self):
+        """
+        预热识别和媒体库存在性缓存：在刷新空闲时识别最近历史记录和进行中订阅的标题，
+        并提前刷新即将过期的识别结果，让定时刷新尽量命中缓存
+        """
+        from app.core.metainfo import MetaInfo
+
+        if self._running or not self._cache_ttl:
+            return
+        # 距过期不足一个预热间隔的条目视为需要刷新
+        within = self._warmup_interval * 60 * 1.5
+        sources: Dict[str, Tuple[str, Optional[str]]] = {}
+        for key, (_, title, subtitle) in self._recognize_cache.expiring(within):
+            sources[key] = (title, subtitle)
+        for title in self.__warmup_titles():
+            meta = MetaInfo(title=title)
+            if meta.name:
+                key = self.__recognize_key(meta)
+                if key not in sources and self._recognize_cache.expires_within(key, within):
+                    sources[key] = (title, None)
+        if not sources:
+            return
+        logger.info(f"自定义订阅无通知：开始预热 {len(sources)} 个识别缓存")
+        warmed = 0
+        for title, subtitle in sources.values():
+            if self._running or self._event.is_set():
+                logger.info("自定义订阅无通知：刷新开始，暂停预热")
+                break
+            try:
+                meta = MetaInfo(title=title, subtitle=subtitle)
+                mediainfo = self.__recognize(meta=meta, title=title, subtitle=subtitle, refresh=True)
+                if mediainfo:
+                    self.__media_exists(mediainfo=mediainfo, refresh=True)
+                    warmed += 1
+            except Exception as err:
+                logger.warn(f"预热识别缓存出错：{title} - {str(err)}")
+        self.__save_alias_index()
+        logger.info(f"自定义订阅无通知：预热完成，已缓存 {warmed} 个媒体")
+
+    def __warmup_titles(self) -> List[str]:
+        """
+        预热来源：最近的历史记录和进行中的订阅
+        """
+        titles = [h.get("key") for h in (self.get_data('history') or [])[-100:] if h.get("key")]
+        try:
+            from app.db.subscribe_oper import SubscribeOper
+
+            for subscribe in SubscribeOper().list("R") or []:
+                if subscribe.type == MediaType.TV.value:
+                    titles.append(f"{subscribe.name} S{(subscribe.season or 1):02d}")
+                else:
+                    titles.append(f"{subscribe.name} {subscribe.year or ''}".strip())
+        except Exception as err:
+            logger.warn(f"读取订阅用于预热失败：{str(err)}")
+        return titles
+
+    @staticmethod
+    def __recognize_key(meta: Any) -> str:
+        return f"{meta.name}|{meta.year or ''}|{meta.type.value if meta.type else ''}"
+
+    def __recognize(self, meta: Any, title: str, subtitle: Optional[str] = None,
+                    refresh: bool = False) -> Optional[Any]:
+        """
+        识别媒体信息，优先使用缓存
+        """
+        key = self.__recognize_key(meta)
+        if not refresh:
+            cached = self._recognize_cache.get(key)
+            self._metrics.inc("cache_requests_total", cache="recognize", result="hit" if cached else "miss")
+            if cached:
+                return cached[0]
+        mediainfo = self.__recognize_alias(meta) if self._alias else None
+        if not mediainfo:
+            mediainfo = self.chain.recognize_media(meta=meta)
+            if mediainfo and self._alias:
+                aliases = self.__alias_index()
+                aliases.add(meta.name, mediainfo.tmdb_id, mediainfo.type.value, mediainfo.year)
+                aliases.add(mediainfo.title, mediainfo.tmdb_id, mediainfo.type.value, mediainfo.year)
+        if mediainfo and self._cache_ttl:
+            self._recognize_cache.set(key, (mediainfo, title, subtitle), self._cache_ttl * 60)
+            if mediainfo.tmdb_id:
+                self._media_cache.set(f"{mediainfo.type.value}|{mediainfo.tmdb_id}", (mediainfo,),
+                                      self._cache_ttl * 60)
+        return mediainfo
+
+    def __recognize_alias(self, meta: Any) -> Optional[Any]:
+        """
+        按别名索引识别：可信命中时直接使用缓存的媒体信息，否则按TMDB编号精确识别；未命中返回 None
+        """
+        hit = self.__alias_index().find(meta.name, year=meta.year,
+                                        mtype=meta.type.value if meta.type else None)
+        self._metrics.inc("cache_requests_total", cache="alias", result="hit" if hit else "miss")
+        if not hit:
+            return None
+        tmdbid, mtype, _, score = hit
+        cached = self._media_cache.get(f"{mtype}|{tmdbid}")
+        if cached:
+            logger.debug(f"{meta.name} - 别名索引命中 {mtype} {tmdbid}（相似度 {score:.2f}），使用缓存媒体信息")
+            return cached[0]
+        logger.debug(f"{meta.name} - 别名索引命中 {mtype} {tmdbid}（相似度 {score:.2f}），按编号识别")
+        return self.chain.recognize_media(meta=meta, tmdbid=tmdbid, mtype=MediaType(mtype))
+
+    def __alias_index(self) -> _AliasIndex:
+        """
+        获取别名索引，首次使用时从存储加载，为空时用历史记录的媒体标题初始化
+        """
+        if self._alias_index is None:
+            aliases = _AliasIndex(aliases=self.get_data('alias_index') or {})
+            if not len(aliases):
+                for record in self.get_data('history') or []:
+                    if record.get("tmdbid") and record.get("type"):
+                        # 去掉历史标题末尾的季或年份
+                        name = re.sub(r"\s+(S\d+(-S\d+)?|\(\d{4}\))\s*$", "", record.get("title") or "")
+                        aliases.add(name, record.get("tmdbid"), record.get("type"), record.get("year"))
+                logger.info(f"自定义订阅无通知：从历史记录初始化别名索引，共 {len(aliases)} 个名称")
+            self._alias_index = aliases
+        return self._alias_index
+
+    def __save_alias_index(self):
+        """
+        别名索引有新增时落盘
+        """
+        if self._alias_index is not None and self._alias_index.dirty:
+            self.save_data('alias_index', self._alias_index.to_dict())
+
+    def __media_exists(self, mediainfo: Any, refresh: bool = False) -> Optional[Any]:
+        """
+        查询媒体库是否存在，优先使用缓存
+        """
+        key = f"{mediainfo.type.value}|{mediainfo.tmdb_id or mediainfo.douban_id}"
+        if not refresh:
+            cached = self._exists_cache.get(key)
+            self._metrics.inc("cache_requests_total", cache="exists", result="hit" if cached else "miss")
+            if cached:
+                return cached[0]
+        exist_info = self.chain.media_exists(mediainfo=mediainfo)
+        if self._cache_ttl:
+            self._exists_cache.set(key, (exist_info,), min(self._exists_ttl, self._cache_ttl * 60))
+        return exist_info
+
+    @staticmethod
+    def __history_record(key: str, mediainfo: Any, meta: Any, dedup_keys: List[str]) -> dict:
+        """
+        生成历史记录
+        """
+        return {
+            "title": f"{mediainfo.title} {meta.season}",
+            "key": f"{key}",
+            "type": mediainfo.type.value,
+            "year": mediainfo.year,
+            "poster": mediainfo.get_poster_image(),
+            "overview": mediainfo.overview,
+            "tmdbid": mediainfo.tmdb_id,
+            "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "dedup_keys": dedup_keys
+        }
+
+    def __queue_retry(self, retry_queue: Dict[str, dict], key: str, context: Any,
+                      dedup_keys: List[str], torrent: Optional[dict]):
+        """
+        下载失败的项加入重试队列，保存已识别的媒体和种子信息，重试时跳过解析、识别和过滤
+        """
+        if not self._retry_attempts:
+            return
+        retry_queue[key] = {
+            **self.__serialize_context(context=context, dedup_keys=dedup_keys, torrent=torrent),
+            "attempts": 0,
+            "next_retry": time.time() + self._retry_backoff
+        }
+        self._retry_contexts[key] = context
+        self.save_data('retry_queue', retry_queue)
+        logger.info(f"{key} 已加入下载重试队列，{int(self._retry_backoff / 60)} 分钟后重试")
+
+    def __queue_admission(self, admission_queue: Dict[str, dict], key: str, context: Any,
+                          dedup_keys: List[str], torrent: Optional[dict], reason: str):
+        """
+        超过下载准入限制的项加入准入队列，后续轮次按优先级准入
+        """
+        admission_queue[key] = {
+            **self.__serialize_context(context=context, dedup_keys=dedup_keys, torrent=torrent),
+            "queued": time.time()
+        }
+        self._retry_contexts[key] = context
+        self._metrics.inc("items_total", stage="deferred")
+        self.save_data('admission_queue', admission_queue)
+        logger.info(f"{key} - {reason}，已加入下载准入队列")
+
+    @staticmethod
+    def __serialize_context(context: Any, dedup_keys: List[str], torrent: Optional[dict]) -> dict:
+        """
+        保存已识别的媒体和种子信息，出队时跳过解析、识别和过滤
+        """
+        torrentinfo = context.torrent_info
+        return {
+            "tmdbid": context.media_info.tmdb_id,
+            "type": context.media_info.type.value,
+            "torrent": {
+                "title": torrentinfo.title,
+                "description": torrentinfo.description,
+                "enclosure": torrentinfo.enclosure,
+                "page_url": torrentinfo.page_url,
+                "size": torrentinfo.size,
+                "pubdate": torrentinfo.pubdate,
+                "site_proxy": torrentinfo.site_proxy,
+                "pri_order": getattr(torrentinfo, "pri_order", 0)
+            },
+            "torrent_path": str(torrent["path"]) if torrent else None,
+            "dedup_keys": dedup_keys
+        }
+
+    def __restore_context(self, entry: dict) -> Optional[Any]:
+        """
+        按队列记录重建下载上下文，媒体信息优先使用缓存，否则按TMDB编号识别
+        """
+        from app.core.context import TorrentInfo, Context
+
+        torrent = entry.get("torrent") or {}
+        if not entry.get("tmdbid") or not torrent.get("title"):
+            return None
+        meta = self.__parse_meta(title=torrent.get("title"), subtitle=torrent.get("description"), parsed={})
+        mtype = MediaType(entry.get("type"))
+        cached = self._media_cache.get(f"{mtype.value}|{entry.get('tmdbid')}")
+        mediainfo = cached[0] if cached else self.chain.recognize_media(meta=meta, tmdbid=entry.get("tmdbid"),
+                                                                        mtype=mtype)
+        if not mediainfo:
+            return None
+        return Context(meta_info=meta, media_info=mediainfo, torrent_info=TorrentInfo(**torrent))
+
+    def __retry_downloads(self, retry_queue: Dict[str, dict], downloadchain: Any, history: List[dict],
+                          history_keys: Set[str], dedup: _DedupIndex) -> List[dict]:
+        """
+        重试到期的失败下载，直接进入下载阶段；按指数退避安排下次重试，达到重试次数后放弃
+        """
+        now = time.time()
+        for key in [key for key, entry in retry_queue.items() if entry.get("next_retry", 0) <= now]:
+            if self.__is_aborted():
+                break
+            entry = retry_queue[key]
+            result, context, blocked = self.__download_entry(key=key, entry=entry, downloadchain=downloadchain)
+            if blocked:
+                logger.info(f"{blocked}，暂停重试下载")
+                break
+            if result:
+                retry_queue.pop(key)
+                history = self.__record_entry(key=key, entry=entry, context=context, history=history,
+                                              history_keys=history_keys, dedup=dedup)
+                logger.info(f"{key} 重试下载成功")
+                continue
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            if entry["attempts"] >= self._retry_attempts:
+                retry_queue.pop(key)
+                self._retry_contexts.pop(key, None)
+                logger.error(f"{key} 已重试 {entry['attempts']} 次仍下载失败，放弃")
+                continue
+            delay = self._retry_backoff * 2 ** entry["attempts"]
+            entry["next_retry"] = now + delay
+            logger.warn(f"{key} 第 {entry['attempts']} 次重试下载失败，{int(delay / 60)} 分钟后再试")
+        self.save_data('retry_queue', retry_queue)
+        return history
+
+    def __drain_admission(self, admission_queue: Dict[str, dict], retry_queue: Dict[str, dict],
+                          downloadchain: Any, history: List[dict], history_keys: Set[str],
+                          dedup: _DedupIndex) -> List[dict]:
+        """
+        按优先级从高到低、入队先后准入等待中的下载，遇到准入限制即停止，剩余项留待后续轮次；
+        下载失败的项转入重试队列，等待过久的项放弃
+        """
+        now = time.time()
+        order = sorted(admission_queue.items(),
+                       key=lambda item: (-((item[1].get("torrent") or {}).get("pri_order") or 0),
+                                         item[1].get("queued", 0)))
+        for key, entry in order:
+            if self.__is_aborted():
+                break
+            if key in history_keys or now - entry.get("queued", now) > self._admission_expire:
+                admission_queue.pop(key)
+                self._retry_contexts.pop(key, None)
+                logger.info(f"{key} 已下载或在准入队列中等待过久，移出队列")
+                continue
+            result, context, blocked = self.__download_entry(key=key, entry=entry, downloadchain=downloadchain)
+            if blocked:
+                logger.info(f"{blocked}，下载准入队列剩余 {len(admission_queue)} 项")
+                break
+            admission_queue.pop(key)
+            if result:
+                history = self.__record_entry(key=key, entry=entry, context=context, history=history,
+                                              history_keys=history_keys, dedup=dedup)
+                logger.info(f"{key} 已从下载准入队列下载")
+            elif context and self._retry_attempts:
+                retry_queue[key] = {
+                    **entry,
+                    "attempts": 0,
+                    "next_retry": now + self._retry_backoff
+                }
+                retry_queue[key].pop("queued", None)
+                logger.error(f"{key} 下载失败，已转入下载重试队列")
+            else:
+                self._retry_contexts.pop(key, None)
+                logger.error(f"{key} 下载失败")
+        self.save_data('admission_queue', admission_queue)
+        self.save_data('retry_queue', retry_queue)
+        return history
 
-        return [
-            {
-                'component': 'div',
-                'props': {
-                    'class': 'grid gap-3 grid-info-card',
-                },
-                'content': contents
+    def __download_entry(self, key: str, entry: dict,
+                         downloadchain: Any) -> Tuple[Any, Optional[Any], Optional[str]]:
+        """
+        按队列记录下载，预取的种子文件仍存在时直接使用；按分配的下载器做准入检查，未准入时不下载；
+        返回下载结果、下载上下文和未准入原因
+        """
+        result = None
+        context = None
+        try:
+            context = self._retry_contexts.get(key) or self.__restore_context(entry)
+            if context:
+                torrent_path = Path(entry["torrent_path"]) if entry.get("torrent_path") else None
+                torrent = {"path": torrent_path} if torrent_path and torrent_path.exists() else None
+                downloader = self.__route_downloader(mediainfo=context.media_info, size=context.torrent_info.size)
+                blocked = self.__admission_blocked(size=context.torrent_info.size, downloader=downloader)
+                if blocked:
+                    return None, context, blocked
+                result = downloadchain.download_single(
+                    context=context,
+                    save_path=self._save_path or None,
+                    username="RSS订阅无通知",
+                    downloader=downloader,
+                    **self.__torrent_kwargs(downloadchain, torrent)
+                )
+                if result:
+                    self.__record_route(mediainfo=context.media_info, name=downloader,
+                                        size=context.torrent_info.size)
+        except Exception as err:
+            logger.error(f"{key} 下载出错：{str(err)}")
+        return result, context, None
+
+    def __record_entry(self, key: str, entry: dict, context: Any, history: List[dict],
+                       history_keys: Set[str], dedup: _DedupIndex) -> List[dict]:
+        """
+        队列中的项下载成功后写入历史记录和去重索引
+        """
+        self._retry_contexts.pop(key, None)
+        self.__admit()
+        self._metrics.inc("items_total", stage="acted")
+        self.__record_latency(context.torrent_info.pubdate)
+        history.append(self.__history_record(key=key, mediainfo=context.media_info, meta=context.meta_info,
+                                             dedup_keys=entry.get("dedup_keys") or []))
+        history_keys.add(key)
+        dedup.add(entry.get("dedup_keys") or [])
+        history = self.__save_history(history)
+        self.__save_dedup(dedup)
+        return history
+
+    def __record_latency(self, pubdate: Any):
+        """
+        记录发布时间到下载成功的时延，没有发布时间的项不记录
+        """
+        if isinstance(pubdate, str):
+            try:
+                pubdate = datetime.datetime.strptime(pubdate, "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                return
+        if not isinstance(pubdate, datetime.datetime):
+            return
+        latency = max(0.0, time.time() - pubdate.timestamp())
+        self._metrics.observe("grab_latency_seconds", latency)
+        self._latencies.append(latency)
+
+    def __admission_limited(self) -> bool:
+        """
+        是否配置了下载准入限制
+        """
+        return bool(self._max_per_run or self._max_per_hour or self._max_active or self._min_free_gb)
+
+    def __admission_state(self) -> dict:
+        """
+        本轮准入状态，首次使用时采集下载器活动任务数，并加载最近一小时的下载时间
+        """
+        if self._admission is None:
+            active = 0
+            if self._max_active:
+                active = sum(load["active"] for load in self.__downloader_loads().values())
+            self._admission = {
+                "admitted": 0,
+                "active": active,
+                "grabs": [ts for ts in self.get_data('grab_times') or [] if ts > time.time() - 3600]
             }
-        ]
+        return self._admission
 
-    def stop_service(self):
+    def __admission_blocked(self, size: Any, downloader: Optional[str]) -> Optional[str]:
         """
-        退出插件
+        下载准入检查：达到每轮、每小时或同时活动任务上限，或分配的下载器（未分配时为默认下载器）
+        下载后剩余空间低于下限时返回原因，否则返回 None
+        """
+        if not self.__admission_limited():
+            return None
+        state = self.__admission_state()
+        if self._max_per_run and state["admitted"] >= self._max_per_run:
+            return f"本轮已下载 {state['admitted']} 个"
+        state["grabs"] = [ts for ts in state["grabs"] if ts > time.time() - 3600]
+        if self._max_per_hour and len(state["grabs"]) >= self._max_per_hour:
+            return f"最近一小时已下载 {len(state['grabs'])} 个"
+        if self._max_active and state["active"] + state["admitted"] >= self._max_active:
+            return f"下载器活动任务已有 {state['active'] + state['admitted']} 个"
+        if self._min_free_gb:
+            loads = self.__downloader_loads()
+            name = downloader or self.__default_downloader(loads)
+            free = loads[name]["free"] if name in loads else None
+            if free is not None and free - self.__to_float(size, 0) < self._min_free_gb * 1024 ** 3:
+                return f"下载器 {name} 下载后剩余空间将低于 {self._min_free_gb} GB"
+        return None
+
+    def __admit(self):
+        """
+        记录已准入的下载，计入本轮下载数和最近一小时的下载时间；占用的空间由下载器负载记录
+        """
+        if not self.__admission_limited():
+            return
+        state = self.__admission_state()
+        state["admitted"] += 1
+        state["grabs"].append(time.time())
+        self.save_data('grab_times', state["grabs"])
+
+    def __load_subscriptions(self) -> Optional[_SubscriptionIndex]:
+        """
+        一次性加载全部订阅建立索引，加载失败时返回 None，改为逐项查询
         """
         try:
-            if self._scheduler:
-                self._scheduler.remove_all_jobs()
-                if self._scheduler.running:
-                    self._scheduler.shutdown()
-                self._scheduler = None
-        except Exception as e:
-            logger.error("退出插件失败：%s" % str(e))
+            from app.db.subscribe_oper import SubscribeOper
 
-    def delete_history(self, key: str, apikey: str):
+            index = _SubscriptionIndex()
+            for subscribe in SubscribeOper().list() or []:
+                index.add(subscribe.tmdbid, subscribe.doubanid, subscribe.season)
+            return index
+        except Exception as err:
+            logger.warn(f"加载订阅索引失败，改为逐项查询：{str(err)}")
+            return None
+
+    @staticmethod
+    def __unsettle(batch: dict, title: str, pubdate: Any):
         """
-        删除同步历史记录
+        未得出最终结果的项不计入检查点的已处理项，源水位不越过其发布时间，下一轮重新处理
         """
-        if apikey != settings.API_TOKEN:
-            return schemas.Response(success=False, message="API密钥错误")
-        # 历史记录
-        historys = self.get_data('history')
-        if not historys:
-            return schemas.Response(success=False, message="未找到历史记录")
-        # 删除指定记录
-        historys = [h for h in historys if h.get("title") != key]
-        self.save_data('history', historys)
-        return schemas.Response(success=True, message="删除成功")
+        if title in batch["processed_keys"]:
+            batch["processed_keys"].discard(title)
+            batch["processed"].remove(title)
+        if isinstance(pubdate, datetime.datetime):
+            timestamp = pubdate.timestamp()
+            batch["unsettled"] = min(batch["unsettled"] or timestamp, timestamp)
 
-    def __update_config(self):
+    def __add_subscribes(self, subscribechain: Any, new_subscribes: List[Tuple[dict, dict, List[str], dict, Any]],
+                         history: List[dict], history_keys: Set[str], dedup: _DedupIndex) -> List[dict]:
         """
-        更新设置
+        批量添加本批新订阅，成功的统一写入历史记录；失败的移出检查点的已处理项并阻止源水位越过，下一轮重新处理
         """
-        self.update_config({
-            "enabled": self._enabled,
-            "notify": False,
-            "onlyonce": self._onlyonce,
-            "cron": self._cron,
-            "address": self._address,
-            "include": self._include,
-            "exclude": self._exclude,
-            "proxy": self._proxy,
-            "clear": self._clear,
-            "filter": self._filter,
-            "action": self._action,
-            "save_path": self._save_path,
-            "size_range": self._size_range
-        })
+        if not new_subscribes:
+            return history
+        added = 0
+        for subscribe, record, dedup_keys, batch, pubdate in new_subscribes:
+            started = time.perf_counter()
+            try:
+                sid, message = subscribechain.add(**subscribe)
+            except Exception as err:
+                sid, message = None, str(err)
+            self._metrics.observe("stage_seconds", time.perf_counter() - started, stage="action")
+            if not sid:
+                logger.error(f"{record.get('key')} 添加订阅失败：{message}")
+                self.__unsettle(batch=batch, title=record.get("key"), pubdate=pubdate)
+                continue
+            self._metrics.inc("items_total", stage="acted")
+            history.append(record)
+            history_keys.add(record.get("key"))
+            dedup.add(dedup_keys)
+            added += 1
+        new_subscribes.clear()
+        if added:
+            history = self.__save_history(history)
+            self.__save_dedup(dedup)
+        return history
 
-    def check(self):
+    def __prefetch_torrents(self, results: List[dict], dedup: _DedupIndex,
+                            prefetched: Set[str]) -> Dict[str, dict]:
         """
-        通过用户RSS同步豆瓣想看数据
+        并发预取种子文件到按内容哈希命名的本地缓存，解析信息哈希、实际大小和文件列表；
+        已处理过或本轮已预取的发布跳过；返回 链接 -> 种子信息，未预取的项仍由下载时获取
         """
-        if not self._address:
+        urls = []
+        for result in results:
+            enclosure = result.get("enclosure")
+            if not enclosure or enclosure.startswith("magnet:") or enclosure in urls:
+                continue
+            text = f"{result.get('title')} {result.get('description')}"
+            if self._include and not re.search(r"%s" % self._include, text, re.IGNORECASE):
+                continue
+            if self._exclude and re.search(r"%s" % self._exclude, text, re.IGNORECASE):
+                continue
+            keys = dedup.item_keys(title=result.get("title"), enclosure=enclosure, link=result.get("link"))
+            if dedup.find(keys) or prefetched.intersection(keys):
+                continue
+            prefetched.update(keys)
+            urls.append(enclosure)
+        if not urls:
+            return {}
+        urls = urls[:self._prefetch_limit]
+        torrents = {}
+        with ThreadPoolExecutor(max_workers=min(self._fetch_workers, len(urls))) as pool:
+            for url, torrent in zip(urls, pool.map(self.__prefetch_torrent, urls)):
+                if torrent:
+                    torrents[url] = torrent
+        logger.info(f"自定义订阅无通知：预取种子 {len(torrents)}/{len(urls)} 个")
+        return torrents
+
+    def __prefetch_torrent(self, url: str) -> Optional[dict]:
+        """
+        获取单个种子文件，已缓存时直接读取本地文件
+        """
+        from app.db.site_oper import SiteOper
+        from app.utils.http import RequestUtils
+        from app.utils.string import StringUtils
+
+        folder = self._cache_path / "torrents"
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        link = folder / f"{digest}.url"
+        try:
+            # 链接 -> 内容哈希的映射，命中时复用已下载的种子
+            if link.exists():
+                path = folder / f"{link.read_text().strip()}.torrent"
+                if path.exists():
+                    torrent = _torrent_meta(path.read_bytes())
+                    torrent["path"] = path
+                    self._metrics.inc("cache_requests_total", cache="torrent", result="hit")
+                    return torrent
+            self._metrics.inc("cache_requests_total", cache="torrent", result="miss")
+            # 不占用RSS刷新的令牌，也不等待，避免预取拖慢本轮处理
+            bucket = self.__host_bucket(f"prefetch|{urlparse(url).netloc or url}", capacity=self._prefetch_burst)
+            if bucket and not bucket.try_acquire():
+                logger.debug(f"预取种子已达站点限速，留待下载时获取：{url}")
+                return None
+            site = SiteOper().get_by_domain(StringUtils.get_url_domain(url))
+            res = RequestUtils(ua=(site.ua if site else None) or settings.USER_AGENT,
+                               cookies=site.cookie if site else None,
+                               proxies=settings.PROXY if self._proxy else None,
+                               timeout=30).get_res(url)
+            if not res or res.status_code != 200 or not res.content:
+                logger.warn(f"预取种子失败：{url} - {res.status_code if res is not None else '无响应'}")
+                return None
+            content = res.content
+            torrent = _torrent_meta(content)
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"{hashlib.sha1(content).hexdigest()}.torrent"
+            if not path.exists():
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(content)
+                tmp.replace(path)
+            link.write_text(path.stem)
+            torrent["path"] = path
+            return torrent
+        except Exception as err:
+            logger.warn(f"预取种子失败：{url} - {str(err)}")
+            return None
+
+    def __prune_torrents(self):
+        """
+        清理超过保留天数的种子缓存
+        """
+        folder = self._cache_path / "torrents"
+        if not folder.exists():
             return
-        # 读取历史记录
-        if self._clearflag:
-            history = []
-        else:
-            history: List[dict] = self.get_data('history') or []
-        downloadchain = SilentDownloadChain()
-        subscribechain = SilentSubscribeChain()
-        rulehelper = RuleHelper()
-        for url in self._address.splitlines():
-            # 处理每一个RSS链接
-            url = url.strip()
-            if not url:
+        oldest = time.time() - self._torrent_keep_days * 86400
+        for path in folder.iterdir():
+            try:
+                if path.stat().st_mtime < oldest:
+                    path.unlink()
+            except OSError:
                 continue
+
+    @staticmethod
+    def __torrent_kwargs(downloadchain: Any, torrent: Optional[dict]) -> dict:
+        """
+        将预取的种子交给下载链，按当前版本 download_single 支持的参数传入
+        """
+        if not torrent:
+            return {}
+        params = inspect.signature(downloadchain.download_single).parameters
+        if "torrent_file" in params:
+            return {"torrent_file": torrent["path"]}
+        if "torrent_content" in params:
+            return {"torrent_content": torrent["path"].read_bytes()}
+        return {}
+
+    def __route_downloader(self, mediainfo: Any, size: Any) -> Optional[str]:
+        """
+        为直接下载选择下载器：同一剧集优先沿用此前的下载器，其余选择活动任务最少、下载速度最低的下载器；
+        剩余空间不足以容纳种子的下载器不参与分配，未配置下载器时由系统选择默认下载器
+        """
+        if not self._downloaders:
+            return None
+        if len(self._downloaders) == 1:
+            return self._downloaders[0]
+        loads = self.__downloader_loads()
+        needed = self.__to_float(size, 0) * 1.1
+        usable = [name for name in self._downloaders
+                  if name in loads and (loads[name]["free"] is None or loads[name]["free"] >= needed)]
+        if not usable:
+            logger.warn("自定义订阅无通知：没有可用或剩余空间足够的下载器，交由系统选择")
+            return None
+        sticky_key = self.__sticky_key(mediainfo)
+        name = self._routes.get(sticky_key) if sticky_key else None
+        sticky = name in usable
+        if not sticky:
+            name = min(usable, key=lambda item: (loads[item]["active"], loads[item]["speed"],
+                                                 -(loads[item]["free"] or 0)))
+        logger.info(f"{mediainfo.title_year} - 分配下载器：{name}（{'沿用' if sticky else '均衡'}），"
+                    f"活动任务 {loads[name]['active']} 个")
+        return name
+
+    def __record_route(self, mediainfo: Any, name: Optional[str], size: Any):
+        """
+        下载成功后记录分配：本轮负载计入新任务，剧集沿用该下载器，累计分配统计
+        """
+        loads = self._downloader_loads or {}
+        target = name or self.__default_downloader(loads)
+        if target in loads:
+            loads[target]["active"] += 1
+            if loads[target]["free"] is not None:
+                loads[target]["free"] -= self.__to_float(size, 0) * 1.1
+        if not name or len(self._downloaders) < 2:
+            return
+        sticky_key = self.__sticky_key(mediainfo)
+        reason = "sticky" if sticky_key and self._routes.get(sticky_key) == name else "balanced"
+        if sticky_key:
+            self._routes.pop(sticky_key, None)
+            self._routes[sticky_key] = name
+        self._metrics.inc("downloader_routes_total", downloader=name, reason=reason)
+        route_stats = self.get_data('route_stats') or {}
+        route_stats[name] = route_stats.get(name, 0) + 1
+        self.save_data('route_stats', route_stats)
+
+    @staticmethod
+    def __default_downloader(loads: Dict[str, dict]) -> Optional[str]:
+        """
+        未分配下载器时系统使用的默认下载器，只有一个下载器时即为该下载器
+        """
+        name = next((name for name, load in loads.items() if load.get("default")), None)
+        if not name and len(loads) == 1:
+            name = next(iter(loads))
+        return name
+
+    @staticmethod
+    def __sticky_key(mediainfo: Any) -> Optional[str]:
+        """
+        剧集沿用下载器的键，电影不沿用
+        """
+        if mediainfo.type == MediaType.TV and mediainfo.tmdb_id:
+            return f"{mediainfo.type.value}|{mediainfo.tmdb_id}"
+        return None
+
+    def __downloader_loads(self) -> Dict[str, dict]:
+        """
+        采集各下载器的活动任务数、当前下载速度和剩余空间，每轮采集一次；获取失败的下载器不参与分配；
+        未配置下载器时采集全部下载器，用于下载准入检查；剩余空间仅在设置了最低剩余空间或需要在多个下载器间分配时采集
+        """
+        if self._downloader_loads is not None:
+            return self._downloader_loads
+        from app.helper.downloader import DownloaderHelper
+
+        loads = {}
+        need_free = bool(self._min_free_gb) or len(self._downloaders) > 1
+        helper = DownloaderHelper()
+        for name in self._downloaders or list((helper.get_services() or {}).keys()):
+            try:
+                service = helper.get_service(name=name)
+                if not service or not service.instance or service.instance.is_inactive():
+                    logger.warn(f"下载器 {name} 未连接，不参与分配")
+                    continue
+                instance = service.instance
+                torrents = instance.get_downloading_torrents()
+                if isinstance(torrents, tuple):
+                    torrents = torrents[0]
+                info = instance.transfer_info() or {}
+                speed = info.get("dl_info_speed") if isinstance(info, dict) else getattr(info, "dl_info_speed", 0)
+                loads[name] = {
+                    "active": len(torrents or []),
+                    "speed": self.__to_float(speed, 0),
+                    "free": self.__free_space(name, instance) if need_free else None,
+                    "default": bool(getattr(getattr(service, "config", None), "default", False))
+                }
+            except Exception as err:
+                logger.warn(f"获取下载器 {name} 状态失败，不参与分配：{str(err)}")
+        self._downloader_loads = loads
+        return loads
+
+    def __free_space(self, name: str, instance: Any) -> Optional[float]:
+        """
+        下载器上报的下载目录剩余空间，下载器可能在其它主机，不读取本机磁盘；无法获取时返回 None；
+        qBittorrent 完整同步会返回全部种子，按上次的 rid 增量同步，未变化的剩余空间沿用上次的值
+        """
+        try:
+            qbc = getattr(instance, "qbc", None)
+            if qbc:
+                rid, free = self._maindata_sync.get(name) or (0, None)
+                maindata = qbc.sync_maindata(rid=rid) or {}
+                if rid and maindata.get("full_update"):
+                    free = None
+                free = (maindata.get("server_state") or {}).get("free_space_on_disk", free)
+                free = float(free) if free is not None else None
+                self._maindata_sync[name] = (self.__to_int(maindata.get("rid"), 0), free)
+                return free
+            trc = getattr(instance, "trc", None)
+            if trc:
+                free = getattr(trc.get_session(), "download_dir_free_space", None)
+                return float(free) if free is not None else None
+        except Exception as err:
+            logger.debug(f"获取下载器剩余空间失败：{str(err)}")
+        return None
+
+    def __in_library(self, mediainfo: Any, meta: Any) -> bool:
+        """
+        媒体库是否已有该电影或本项的全部剧集，启用快照索引时只查内存，否则查询媒体服务器
+        """
+        index = self.__library() if self._library_index and mediainfo.tmdb_id else None
+        if index is not None:
+            if mediainfo.type == MediaType.TV:
+                return index.has_episodes(mediainfo.tmdb_id, meta.begin_season, meta.episode_list)
+            return index.has_movie(mediainfo.tmdb_id)
+        exist_info = self.__media_exists(mediainfo=mediainfo)
+        if not exist_info:
+            return False
+        if mediainfo.type != MediaType.TV:
+            return True
+        exist_episodes = (exist_info.seasons or {}).get(meta.begin_season)
+        if not exist_episodes:
+            return False
+        need = _LibraryIndex.mask(meta.episode_list)
+        return need & _LibraryIndex.mask(exist_episodes) == need
+
+    def __library(self) -> Optional[_LibraryIndex]:
+        """
+        获取媒体库快照索引，从媒体服务器同步数据一次性加载，超过有效期重新加载；
+        读取失败或媒体库为空时返回 None，改为逐项查询
+        """
+        with self._library_lock:
+            if self._library and time.time() - self._library.loaded < self._exists_ttl:
+                return self._library
+            started = time.perf_counter()
+            try:
+                from app.db import SessionFactory
+                from app.db.models.mediaserver import MediaServerItem
+
+                index = _LibraryIndex()
+                with SessionFactory() as db:
+                    rows = db.query(MediaServerItem.item_type,
+                                    MediaServerItem.tmdbid,
+                                    MediaServerItem.seasoninfo).filter(MediaServerItem.tmdbid.isnot(None)).all()
+                for item_type, tmdbid, seasoninfo in rows:
+                    index.add(item_type, tmdbid, seasoninfo if isinstance(seasoninfo, dict) else None)
+            except Exception as err:
+                logger.warn(f"加载媒体库快照失败，改为逐项查询：{str(err)}")
+                return None
+            if not len(index):
+                logger.warn("媒体库快照为空，请先同步媒体服务器，暂时改为逐项查询")
+                return None
+            self._library = index
+            logger.info(f"自定义订阅无通知：已加载媒体库快照，电影 {len(index.movies)} 部，剧集 {len(index.episodes)} 部，"
+                        f"耗时 {(time.perf_counter() - started) * 1000:.0f} ms")
+            return index
+
+    def __chain_context(self) -> _ChainContext:
+        """
+        获取复用的链路上下文，首次使用或配置变更后创建
+        """
+        with self._chains_lock:
+            if not self._chains:
+                self._chains = _ChainContext()
+            return self._chains
+
+    def __fetch_feeds(self, urls: List[str], probes: set) -> Dict[str, Tuple[Optional[List[dict]], float]]:
+        """
+        并发获取RSS报文，同一站点的请求由令牌桶限速，返回报文和请求耗时
+        """
+        workers = min(self._fetch_workers, len(urls))
+        if workers <= 1:
+            return {url: self.__fetch_feed(url, retries=0 if url in probes else self._fetch_retries)
+                    for url in urls}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss-fetch") as executor:
+            futures = {url: executor.submit(self.__fetch_feed, url,
+                                            0 if url in probes else self._fetch_retries)
+                       for url in urls}
+            return {url: future.result() for url, future in futures.items()}
+
+    def __fetch_feed(self, url: str, retries: int) -> Tuple[Optional[List[dict]], float]:
+        """
+        获取单个RSS报文，失败时按指数退避加随机抖动重试
+        """
+        rsshelper = self.__chain_context().rsshelper
+        bucket = self.__host_bucket(urlparse(url).netloc or url)
+        latency = 0
+        for attempt in range(retries + 1):
+            if bucket and not bucket.acquire(self._run_event):
+                return None, latency
             logger.info(f"开始刷新RSS：{url} ...")
-            results = RssHelper().parse(url, proxy=self._proxy)
-            if not results:
-                logger.error(f"未获取到RSS数据：{url}")
-                continue
-            # 过滤规则
-            filter_groups = self.systemconfig.get(SystemConfigKey.SubscribeFilterRuleGroups)
-            # 解析数据
-            for result in results:
-                try:
-                    title = result.get("title")
-                    description = result.get("description")
-                    enclosure = result.get("enclosure")
-                    link = result.get("link")
-                    size = result.get("size")
-                    pubdate: datetime.datetime = result.get("pubdate")
-                    # 检查是否处理过
-                    if not title or title in [h.get("key") for h in history]:
-                        continue
-                    # 检查规则
-                    if self._include and not re.search(r"%s" % self._include,
-                                                       f"{title} {description}", re.IGNORECASE):
-                        logger.info(f"{title} - {description} 不符合包含规则")
-                        continue
-                    if self._exclude and re.search(r"%s" % self._exclude,
-                                                   f"{title} {description}", re.IGNORECASE):
-                        logger.info(f"{title} - {description} 不符合排除规则")
-                        continue
-                    if self._size_range:
-                        sizes = [float(_size) * 1024 ** 3 for _size in self._size_range.split("-")]
-                        if len(sizes) == 1 and float(size) < sizes[0]:
-                            logger.info(f"{title} - 种子大小不符合条件")
-                            continue
-                        elif len(sizes) > 1 and not sizes[0] <= float(size) <= sizes[1]:
-                            logger.info(f"{title} - 种子大小不在指定范围")
-                            continue
-                    # 识别媒体信息
-                    meta = MetaInfo(title=title, subtitle=description)
-                    if not meta.name:
-                        logger.warn(f"{title} 未识别到有效数据")
-                        continue
-                    mediainfo: MediaInfo = self.chain.recognize_media(meta=meta)
-                    if not mediainfo:
-                        logger.warn(f'未识别到媒体信息，标题：{title}')
-                        continue
-                    # 种子
-                    torrentinfo = TorrentInfo(
-                        title=title,
-                        description=description,
-                        enclosure=enclosure,
-                        page_url=link,
-                        size=size,
-                        pubdate=pubdate.strftime("%Y-%m-%d %H:%M:%S") if pubdate else None,
-                        site_proxy=self._proxy,
-                    )
-                    # 过滤种子
-                    if self._filter:
-                        active_groups = rulehelper.get_rule_group_by_media(
-                            media=mediainfo,
-                            group_names=filter_groups
-                        )
-                        active_group_names = [group.name for group in active_groups]
-                        media_category = mediainfo.category or "未分类"
-                        if not active_group_names:
-                            logger.info(
-                                f"{title} - 未匹配到适用订阅规则组，"
-                                f"类型：{mediainfo.type.value}，分类：{media_category}"
-                            )
-                            continue
-                        logger.info(
-                            f"{title} - 使用订阅规则组：{', '.join(active_group_names)}，"
-                            f"类型：{mediainfo.type.value}，分类：{media_category}"
-                        )
-                        matched_torrents = self.chain.filter_torrents(
-                            rule_groups=filter_groups,
-                            torrent_list=[torrentinfo],
-                            mediainfo=mediainfo
-                        )
-                        if not matched_torrents:
-                            logger.info(f"{title} - 不匹配订阅规则组：{', '.join(active_group_names)}")
-                            continue
-                        torrentinfo = matched_torrents[0]
-                        logger.info(
-                            f"{title} - 已命中订阅规则组：{', '.join(active_group_names)}，"
-                            f"优先级：{getattr(torrentinfo, 'pri_order', '-')}"
-                        )
-                    # 媒体库已存在的剧集
-                    exist_info: Optional[ExistMediaInfo] = self.chain.media_exists(mediainfo=mediainfo)
-                    if mediainfo.type == MediaType.TV:
-                        if exist_info:
-                            exist_season = exist_info.seasons
-                            if exist_season:
-                                exist_episodes = exist_season.get(meta.begin_season)
-                                if exist_episodes and set(meta.episode_list).issubset(set(exist_episodes)):
-                                    logger.info(f'{mediainfo.title_year} {meta.season_episode} 己存在')
-                                    continue
-                    elif exist_info:
-                        # 电影已存在
-                        logger.info(f'{mediainfo.title_year} 己存在')
-                        continue
-                    # 下载或订阅
-                    if self._action == "download":
-                        # 添加下载
-                        result = downloadchain.download_single(
-                            context=Context(
-                                meta_info=meta,
-                                media_info=mediainfo,
-                                torrent_info=torrentinfo,
-                            ),
-                            save_path=self._save_path or None,
-                            username="RSS订阅无通知"
-                        )
-                        if not result:
-                            logger.error(f'{title} 下载失败')
-                            continue
-                    else:
-                        # 检查是否在订阅中
-                        subflag = subscribechain.exists(mediainfo=mediainfo, meta=meta)
-                        if subflag:
-                            logger.info(f'{mediainfo.title_year} {meta.season} 正在订阅中')
-                            continue
-                        # 添加订阅
-                        subscribechain.add(title=mediainfo.title,
-                                           year=mediainfo.year,
-                                           mtype=mediainfo.type,
-                                           tmdbid=mediainfo.tmdb_id,
-                                           season=meta.begin_season,
-                                           exist_ok=True,
-                                           message=False,
-                                           username="RSS订阅无通知")
-                    # 存储历史记录
-                    history.append({
-                        "title": f"{mediainfo.title} {meta.season}",
-                        "key": f"{title}",
-                        "type": mediainfo.type.value,
-                        "year": mediainfo.year,
-                        "poster": mediainfo.get_poster_image(),
-                        "overview": mediainfo.overview,
-                        "tmdbid": mediainfo.tmdb_id,
-                        "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                except Exception as err:
-                    logger.error(f'刷新RSS数据出错：{str(err)} - {traceback.format_exc()}')
-            logger.info(f"RSS {url} 刷新完成")
-        # 保存历史记录
-        self.save_data('history', history)
-        # 缓存只清理一次
-        self._clearflag = False
+            started = time.monotonic()
+            try:
+                results = rsshelper.parse(url, proxy=self._proxy)
+            except Exception as err:
+                logger.warn(f"获取RSS出错：{url} - {str(err)}")
+                results = None
+            latency = time.monotonic() - started
+            if results is not None and results is not False:
+                return results, latency
+            if attempt < retries:
+                delay = min(30, 2 ** (attempt + 1)) + random.uniform(0, 1)
+                logger.warn(f"获取RSS失败：{url}，{delay:.1f} 秒后第 {attempt + 1} 次重试")
+                if self._run_event.wait(delay):
+                    return None, latency
+        return None, latency
+
+    def __is_breaker_open(self, state: dict) -> bool:
+        """
+        源是否处于熔断期
+        """
+        return bool(self._breaker_threshold) and state.get("open_until", 0) > time.time()
+
+    def __record_feed_health(self, state: dict, results: Optional[List[dict]], latency: float):
+        """
+        记录源的成功/失败、耗时和项数，没有条目的源也算成功；连续失败达到阈值后熔断，熔断时长随失败次数翻倍，最长1天
+        """
+        now = time.time()
+        ok = results is not None and results is not False
+        self._metrics.inc("feed_fetches_total", result="ok" if ok else "error")
+        self._metrics.observe("feed_fetch_seconds", latency)
+        latency_ms = int(latency * 1000)
+        state["latency"] = latency_ms
+        state["avg_latency"] = int(0.3 * latency_ms + 0.7 * state.get("avg_latency", latency_ms))
+        if ok:
+            state["success"] = state.get("success", 0) + 1
+            state["failures"] = 0
+            state["open_until"] = 0
+            state["items"] = len(results)
+            state["last_success"] = now
+            return
+        state["failure"] = state.get("failure", 0) + 1
+        state["failures"] = state.get("failures", 0) + 1
+        state["last_failure"] = now
+        if self._breaker_threshold and state["failures"] >= self._breaker_threshold:
+            exponent = min(state["failures"] - self._breaker_threshold, 6)
+            cooldown = min(1800 * 2 ** exponent, 24 * 3600)
+            state["open_until"] = now + cooldown
+            logger.warn(f"RSS连续失败 {state['failures']} 次，熔断 {int(cooldown / 60)} 分钟")
+
+    def __host_bucket(self, host: str, capacity: float = 1.0) -> Optional[_TokenBucket]:
+        """
+        获取站点的请求令牌桶，不限速时返回None
+        """
+        if self._host_rate <= 0:
+            return None
+        with self._bucket_lock:
+            bucket = self._buckets.get(host)
+            if not bucket:
+                bucket = _TokenBucket(rate_per_minute=self._host_rate, capacity=capacity)
+                self._buckets[host] = bucket
+            return bucket
+
+    def __update_poll_interval(self, state: dict, results: List[dict]):
+        """
+        按源的新项到达速率调整刷新间隔：速率取新项数/小时的指数加权平均，
+        首次刷新用报文内发布时间的跨度估算，间隔限制在最短和最长刷新间隔之间
+        """
+        now = time.time()
+        pubdates = [pubdate.timestamp() for pubdate in (r.get("pubdate") for r in results)
+                    if isinstance(pubdate, datetime.datetime)]
+        rate = state.get("rate", 0)
+        if pubdates:
+            newest = state.get("newest")
+            last_poll = state.get("last_poll")
+            if newest and last_poll:
+                new_count = sum(1 for ts in pubdates if ts > newest)
+                observed = new_count / max((now - last_poll) / 3600, 1 / 60)
+                rate = 0.3 * observed + 0.7 * rate
+            elif len(pubdates) > 1:
+                span = (max(pubdates) - min(pubdates)) / 3600
+                rate = (len(pubdates) - 1) / span if span > 0 else 0
+            state["newest"] = max(newest or 0, max(pubdates))
+        if rate > 0:
+            # 预计每出现一个新项刷新一次
+            interval = 3600 / rate
+        else:
+            interval = state.get("interval", self._poll_min * 60) * 2
+        interval = min(max(interval, self._poll_min * 60), self._poll_max * 60)
+        state.update({
+            "rate": round(rate, 4),
+            "interval": int(interval),
+            "last_poll": now,
+            "next_poll": now + interval
+        })
+        if self._adaptive:
+            logger.info(f"RSS新项速率：{rate:.2f} 项/小时，下次刷新间隔 {int(interval / 60)} 分钟")
+
+    def __numeric_prefilter(self, results: List[dict], watermark: Optional[float] = None) -> List[dict]:
+        """
+        按种子大小、发布时间和源水位一次性筛掉不可能命中的项，先于任何字符串和正则处理
+        """
+        oldest = time.time() - self._max_age * 3600 if self._max_age else None
+        if watermark and (not oldest or watermark > oldest):
+            oldest = watermark
+        if not self._size_bounds and not oldest:
+            return results
+        min_size, max_size = self._size_bounds or (0, math.inf)
+        kept = []
+        for result in results:
+            if self._size_bounds:
+                size = self.__to_float(result.get("size"), -1)
+                if not min_size <= size <= max_size:
+                    logger.debug(f"{result.get('title')} - 种子大小不在指定范围")
+                    continue
+            if oldest:
+                pubdate = result.get("pubdate")
+                if isinstance(pubdate, datetime.datetime) and pubdate.timestamp() < oldest:
+                    logger.debug(f"{result.get('title')} - 发布时间早于最长发布时间或源水位")
+                    continue
+            kept.append(result)
+        if len(kept) < len(results):
+            logger.info(f"{len(results) - len(kept)} 项不符合种子大小、发布时间或早于源水位，已跳过")
+        return kept
+
+    def __is_aborted(self) -> bool:
+        """
+        插件停止或超过单轮最长运行时间
+        """
+        if self._run_event.is_set():
+            return True
+        return bool(self._deadline) and time.time() > self._deadline
+
+    def __count_run_stat(self, name: str):
+        """
+        累计运行统计
+        """
+        self._metrics.inc("runs_total", outcome=name)
+        run_stats = self.get_data('run_stats') or {}
+        run_stats[name] = run_stats.get(name, 0) + 1
+        self.save_data('run_stats', run_stats)
+
+    def __archive_history(self, history: List[dict], seen: _ScalableBloomFilter, seen_path: Path) -> List[dict]:
+        """
+        只保留最近的历史记录，更早记录的键转入布隆过滤器
+        """
+        if self._clearflag and seen_path.exists():
+            seen_path.unlink()
+        if len(history) <= self._history_limit:
+            return history
+        history = sorted(history, key=lambda h: h.get("time") or "")
+        archived, history = history[:-self._history_limit], history[-self._history_limit:]
+        for record in archived:
+            if record.get("key"):
+                seen.add(record.get("key"))
+        try:
+            seen.save(seen_path)
+        except Exception as err:
+            logger.error(f"保存历史记录过滤器失败：{str(err)}")
+            return history + archived
+        logger.info(f"已将 {len(archived)} 条较早的历史记录转入过滤器，共 {len(seen)} 个键")
+        return history
+
+    def __new_checkpoint(self) -> dict:
+        """
+        创建新一轮刷新的检查点
+        """
+        checkpoint = {
+            "started": time.time(),
+            "feeds": {}
+        }
+        self.save_data('checkpoint', checkpoint)
+        return checkpoint
+
+    def __load_checkpoint(self) -> dict:
+        """
+        读取上次中断的刷新进度，过期或不存在时开始新一轮
+        """
+        checkpoint = self.get_data('checkpoint') or {}
+        started = checkpoint.get("started")
+        if not started or time.time() - started > self._checkpoint_ttl:
+            return self.__new_checkpoint()
+        checkpoint.setdefault("feeds", {})
+        resumed = sum(len(keys) for keys in checkpoint["feeds"].values())
+        logger.info(f"检测到上次未完成的RSS刷新，续跑并跳过已处理的 {resumed} 项")
+        return checkpoint
 
     def __log_and_notify_error(self, message):
         """
@@ -821,9 +3910,70 @@ class RssSubscribeNoNotify(_PluginBase):
             return False
         return True
 
+    @staticmethod
+    def __to_int(value: Any, default: int = 0) -> int:
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def __to_float(value: Any, default: float = 0) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def __freshness(pubdate: Any, weight: float) -> float:
+        """
+        跨源处理顺序的排序键：发布时间距今的秒数除以源权重，越小越先处理；没有发布时间的项排在最后
+        """
+        if not isinstance(pubdate, datetime.datetime):
+            return float("inf")
+        return max(0.0, time.time() - pubdate.timestamp()) / weight
+
+    @staticmethod
+    def __parse_feed_weights(text: Optional[str]) -> Dict[str, float]:
+        """
+        解析源权重，每行“RSS地址|权重”，格式错误或权重不大于0的行忽略
+        """
+        weights = {}
+        for line in str(text or "").splitlines():
+            url, _, weight = line.strip().rpartition("|")
+            try:
+                value = float(weight)
+            except ValueError:
+                continue
+            if url.strip() and value > 0:
+                weights[url.strip()] = value
+        return weights
+
+    def __feed_weights_text(self) -> str:
+        """
+        源权重还原为配置文本
+        """
+        return "\n".join(f"{url}|{weight:g}" for url, weight in self._feed_weights.items())
+
+    @staticmethod
+    def __parse_size_range(size_range: Optional[str]) -> Optional[Tuple[float, float]]:
+        """
+        解析种子大小设置（GB）为字节上下限，单个数字表示下限
+        """
+        if not size_range:
+            return None
+        sizes = [float(_size) * 1024 ** 3 for _size in str(size_range).split("-")]
+        if len(sizes) == 1:
+            return sizes[0], math.inf
+        return sizes[0], sizes[1]
+
     @staticmethod
     def __is_number_or_range(value):
         """
         检查字符串是否表示单个数字或数字范围（如'5', '5.5', '5-10' 或 '5.5-10.2'）
         """
         return bool(re.match(r"^\d+(\.\d+)?(-\d+(\.\d+)?)?$", value))
+
+
+_import_timings["module"] = time.perf_counter() - _import_started
+logger.debug(f"自定义订阅无通知：模块导入耗时 {_import_timings['module'] * 1000:.1f} ms")